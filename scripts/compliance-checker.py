@@ -16,6 +16,9 @@ Environment Variables:
 - TARGET_ORG: Organization to scan (auto-detected if not provided)
 - DRY_RUN: Set to 'true' for testing without applying changes
 - ENABLE_AUTO_ASSIGNMENT: Set to 'true' to enable auto-assignment (default: true)
+- SCAN_FORKS: Set to 'false' to leave forked repositories out of the scan (default: true)
+- SCAN_WORKERS: Number of repositories checked concurrently (default: 16)
+- COMPLIANCE_CACHE_PATH: File listing and ETag cache reused across runs (default: .compliance-cache, empty disables)
 
 Usage:
     export GITHUB_TOKEN=ghp_xxxxx
@@ -24,17 +27,41 @@ Usage:
 """
 
 import os
+import heapq
 import json
+import random
 import re
+import shelve
 import time
-from datetime import datetime, timedelta
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from itertools import chain, repeat
 from github import Github
-from github.GithubException import GithubException
+from github.GithubException import GithubException, RateLimitExceededException
+from github.Repository import Repository
+
+try:
+    # PyGithub 2.x: retries 5xx responses and backs off on secondary rate limits
+    from github.GithubRetry import GithubRetry
+    GITHUB_RETRY = GithubRetry(total=5)
+except ImportError:
+    GITHUB_RETRY = 3
+
+try:
+    import orjson  # Optional: much faster JSON serialization for large reports
+except ImportError:
+    orjson = None
 
 def main():
     """Main function to run compliance checking"""
     print("🚀 Repository Compliance Checker with Auto-Assignment Starting...")
-    print(f"📅 Scan Date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC")
+    # Single scan timestamp so every repository is measured against the same instant
+    scan_time = datetime.now(timezone.utc)
+    print(f"📅 Scan Date: {scan_time.strftime('%Y-%m-%d %H:%M:%S')} UTC")
     
     # GitHub Actions environment detection
     is_github_actions = os.environ.get('GITHUB_ACTIONS') == 'true'
@@ -65,16 +92,18 @@ def main():
     org_name = detect_organization(is_github_actions)
     dry_run = os.environ.get('DRY_RUN', 'false').lower() == 'true'
     enable_assignment = os.environ.get('ENABLE_AUTO_ASSIGNMENT', 'true').lower() == 'true'
+    scan_forks = os.environ.get('SCAN_FORKS', 'true').lower() == 'true'
     
     print(f"🔍 Scanning organization: {org_name}")
     print(f"🧪 Dry run mode: {dry_run}")
     print(f"👥 Auto-assignment: {'enabled' if enable_assignment else 'disabled'}")
+    print(f"🍴 Scan forks: {scan_forks}")
     print(f"🔑 Token type: {'PAT' if token.startswith('ghp_') else 'GitHub App' if token.startswith('ghs_') else 'Unknown'}")
     print(f"🔑 Token length: {len(token)} characters")
     
     try:
-        # Initialize GitHub client with retry logic
-        g = Github(token, retry=3)
+        # Initialize GitHub client with retry logic and full-size pages
+        g = Github(token, retry=GITHUB_RETRY, per_page=100)
         
         # Enhanced token validation for GitHub Actions
         validate_token_permissions(g, org_name, is_github_actions)
@@ -140,9 +169,16 @@ def main():
         print(f"📋 Compliance rules loaded for {org_name}")
         print(f"🎯 Rules: {compliance_rules['description']}")
         
+        # Caches from the previous run: ETags for the repository listing and per-repo file listings
+        cache_path = os.environ.get('COMPLIANCE_CACHE_PATH', '.compliance-cache')
+        http_cache_path = f"{cache_path}-http" if cache_path else ''
+        etag_cache = load_shelve_cache(http_cache_path, 'ETag responses')
+        file_cache = load_shelve_cache(cache_path, 'file listings')
+        
         # Get all repositories with improved pagination
         print(f"📊 Starting repository discovery...")
-        repositories = get_all_repositories_optimized(g, org, org_name, is_github_actions)
+        repositories = get_all_repositories_optimized(g, token, org_name, is_github_actions, etag_cache)
+        save_shelve_cache(http_cache_path, etag_cache, 'ETag responses')
         
         if not repositories:
             print(f"❌ No repositories found!")
@@ -161,60 +197,71 @@ def main():
         total_repos = len(repositories)
         print(f"✅ Successfully discovered {total_repos} repositories")
         
-        # Scan all repositories
-        compliance_issues = []
-        successful_scans = 0
-        failed_scans = 0
+        # The fork flag comes with the listing, so forks can be dropped before any checks run
+        if not scan_forks:
+            repositories = [repo for repo in repositories if not repo.fork]
+            print(f"🍴 Skipping {total_repos - len(repositories)} forked repositories")
+            total_repos = len(repositories)
+        
+        # Batch file, protection and topic metadata into a few GraphQL requests
+        repository_metadata = fetch_repository_metadata(token, org_name)
+        print(f"📊 GraphQL metadata available for {len(repository_metadata)}/{total_repos} repositories")
         
-        print(f"📊 Starting repository compliance scan...")
+        # Scan all repositories concurrently - the checks are network-bound
+        scan_workers = int(os.environ.get('SCAN_WORKERS', '16'))
+
+        print(f"📊 Starting repository compliance scan ({scan_workers} workers)...")
         print(f"{'='*60}")
+
+        # File listings only change on push, so the previous run's listings are reused when possible
+        scan_results = scan_repositories(g, repositories, compliance_rules, scan_workers,
+                                         repository_metadata, file_cache, scan_time)
         
-        for i, repo in enumerate(repositories, 1):
-            try:
-                print(f"📊 Checking ({i}/{total_repos}): {repo.name}")
-                
-                # Check repository compliance
-                issues = check_repository_compliance(repo, compliance_rules)
-                
-                if issues['violations']:
-                    compliance_issues.append(issues)
-                    print(f"❌ Found {len(issues['violations'])} issues in {repo.name}")
-                    
-                    # Apply labels if not in dry run mode
-                    if not dry_run:
-                        success_count = apply_compliance_labels(repo, issues['labels'])
-                        if success_count > 0:
-                            print(f"  ✅ Applied {success_count}/{len(issues['labels'])} labels")
-                    else:
-                        print(f"🧪 Would apply labels: {', '.join(issues['labels'])}")
-                else:
-                    print(f"✅ {repo.name} is compliant")
-                
-                successful_scans += 1
-                
-                # Small delay to be respectful to GitHub API
-                if i % 10 == 0:
-                    time.sleep(1)
-                    
-            except Exception as e:
-                print(f"❌ Error scanning {repo.name}: {e}")
+        scanned_repos = {repo.full_name for repo in repositories}
+        save_shelve_cache(cache_path, file_cache, 'file listings', scanned_repos)
+
+        compliance_issues = []
+        non_compliant_repos = []
+        successful_scans = 0
+        failed_scans = 0
+
+        for repo, issues in scan_results:
+            if issues is None:
                 failed_scans += 1
                 continue
-        
+
+            successful_scans += 1
+            if issues['violations']:
+                compliance_issues.append(issues)
+                non_compliant_repos.append((repo, issues))
+
+        # Apply labels in a second parallel pass over non-compliant repositories only
+        if not dry_run:
+            apply_labels_to_repositories(g, non_compliant_repos, scan_workers)
+        else:
+            for repo, issues in non_compliant_repos:
+                print(f"🧪 Would apply labels to {repo.name}: {', '.join(issues['labels'])}")
+
         print(f"{'='*60}")
         print(f"📊 Repository scan completed")
         print(f"✅ Successful scans: {successful_scans}")
         print(f"❌ Failed scans: {failed_scans}")
         
         # Generate compliance report
-        report = generate_compliance_report(org_name, compliance_issues, total_repos)
+        report = generate_compliance_report(org_name, compliance_issues, total_repos, scan_time)
         print(f"📄 Generated JSON compliance report")
         
+        # Build the HTML dashboard in the background while issues are created over the network
+        report_executor = ThreadPoolExecutor(max_workers=1)
+        dashboard_future = report_executor.submit(generate_html_dashboard, report)
+        
         # Create issues in admin repository if not dry run
         if not dry_run and compliance_issues:
             try:
                 if enable_assignment:
-                    create_compliance_issues_with_assignment(g, org_name, compliance_issues, report)
+                    repositories_by_name = {repo.name: repo for repo, _ in non_compliant_repos}
+                    create_compliance_issues_with_assignment(g, org_name, compliance_issues, report, repositories_by_name,
+                                                             scan_time)
                     print(f"📋 Created compliance tracking issues with auto-assignment")
                 else:
                     create_compliance_issues(g, org_name, compliance_issues, report)
@@ -225,8 +272,9 @@ def main():
             assignment_msg = "with auto-assignment" if enable_assignment else "without assignment"
             print(f"🧪 Would create {len(compliance_issues)} compliance issues in admin repo {assignment_msg}")
         
-        # Generate HTML dashboard
-        generate_html_dashboard(report)
+        # Wait for the HTML dashboard
+        dashboard_future.result()
+        report_executor.shutdown()
         print(f"📊 Generated HTML dashboard")
         
         # Print summary
@@ -277,15 +325,17 @@ def detect_organization(is_github_actions=False):
     print(f"⚠️ No organization detected, using default: {default_org}")
     return default_org
 
-def get_responsible_users(repo, github_client):
+def get_responsible_users(repo, github_client, codeowners_path=None, scan_time=None):
     """
     Get list of users responsible for this repository in priority order
+    Only the CODEOWNERS file recorded by the scan is read; without one the lookup is skipped
     Returns: list of usernames to assign issues to
     """
     responsible_users = []
+    # Issues are processed concurrently, so this repository's lines are printed together at the end
+    log = [f"  🔍 Finding responsible users for {repo.name}..."]
     
     try:
-        print(f"  🔍 Finding responsible users for {repo.name}...")
         
         # 1. Get repository administrators (highest priority)
         try:
@@ -301,77 +351,67 @@ def get_responsible_users(repo, github_client):
                     maintainers.append(collaborator.login)
             
             if admins:
-                print(f"    ✅ Found {len(admins)} admin(s): {', '.join(admins[:3])}")
+                log.append(f"    ✅ Found {len(admins)} admin(s): {', '.join(admins[:3])}")
                 responsible_users.extend(admins[:2])  # Limit to 2 admins
             
             if maintainers and len(responsible_users) < 2:
-                print(f"    ✅ Found {len(maintainers)} maintainer(s): {', '.join(maintainers[:3])}")
+                log.append(f"    ✅ Found {len(maintainers)} maintainer(s): {', '.join(maintainers[:3])}")
                 responsible_users.extend(maintainers[:2])
                 
         except Exception as e:
-            print(f"    ⚠️ Could not get collaborators: {e}")
+            log.append(f"    ⚠️ Could not get collaborators: {e}")
         
-        # 2. Check CODEOWNERS file for designated owners
-        if len(responsible_users) < 2:
+        # 2. Check CODEOWNERS file for designated owners, at the path the compliance scan found
+        if codeowners_path and len(responsible_users) < 2:
             try:
-                codeowners_locations = ['.github/CODEOWNERS', 'CODEOWNERS', 'docs/CODEOWNERS']
+                codeowners_file = repo.get_contents(codeowners_path)
+                codeowners_content = codeowners_file.decoded_content.decode('utf-8')
                 
-                for location in codeowners_locations:
-                    try:
-                        codeowners_file = repo.get_contents(location)
-                        codeowners_content = codeowners_file.decoded_content.decode('utf-8')
-                        
-                        # Parse CODEOWNERS format: * @username or @team/name
-                        owners = re.findall(r'@([a-zA-Z0-9\-_]+)', codeowners_content)
-                        # Filter out team names (contain /) and get individual users
-                        individual_owners = [owner for owner in owners if '/' not in owner]
-                        
-                        if individual_owners:
-                            print(f"    ✅ Found CODEOWNERS: {', '.join(individual_owners[:3])}")
-                            responsible_users.extend(individual_owners[:2])
-                            break
-                            
-                    except:
-                        continue
-                        
+                # Parse CODEOWNERS format: * @username or @team/name
+                owners = re.findall(r'@([a-zA-Z0-9\-_]+)', codeowners_content)
+                # Filter out team names (contain /) and get individual users
+                individual_owners = [owner for owner in owners if '/' not in owner]
+                
+                if individual_owners:
+                    log.append(f"    ✅ Found CODEOWNERS: {', '.join(individual_owners[:3])}")
+                    responsible_users.extend(individual_owners[:2])
+                    
+            except RateLimitExceededException:
+                raise
             except Exception as e:
-                print(f"    ⚠️ Could not check CODEOWNERS: {e}")
+                log.append(f"    ⚠️ Could not check CODEOWNERS: {e}")
         
         # 3. Get last 3 active committers (most familiar with recent changes)
         if len(responsible_users) < 3:
             try:
                 # Get recent commits (last 30 days or last 10 commits, whichever is smaller)
-                since_date = datetime.utcnow() - timedelta(days=30)
+                since_date = (scan_time or datetime.now(timezone.utc)) - timedelta(days=30)
                 commits = list(repo.get_commits(since=since_date)[:10])
                 
-                committer_counts = {}
-                for commit in commits:
-                    if commit.author and commit.author.login:
-                        author = commit.author.login
-                        committer_counts[author] = committer_counts.get(author, 0) + 1
+                committer_counts = Counter(commit.author.login for commit in commits
+                                           if commit.author and commit.author.login)
                 
-                # Sort by commit count, get top committers
-                top_committers = sorted(committer_counts.items(), key=lambda x: x[1], reverse=True)
-                recent_committers = [committer[0] for committer in top_committers[:3]]
+                # Top committers by commit count, without sorting every committer
+                recent_committers = [committer for committer, _ in committer_counts.most_common(3)]
                 
                 if recent_committers:
-                    print(f"    ✅ Found recent committers: {', '.join(recent_committers)}")
+                    log.append(f"    ✅ Found recent committers: {', '.join(recent_committers)}")
                     # Add committers not already in the list
                     for committer in recent_committers:
                         if committer not in responsible_users and len(responsible_users) < 3:
                             responsible_users.append(committer)
                             
             except Exception as e:
-                print(f"    ⚠️ Could not get recent committers: {e}")
+                log.append(f"    ⚠️ Could not get recent committers: {e}")
         
         # 4. Fallback to repository owner/creator
         if len(responsible_users) == 0:
             try:
                 if repo.owner and repo.owner.login not in responsible_users:
-                    print(f"    ✅ Fallback to repository owner: {repo.owner.login}")
+                    log.append(f"    ✅ Fallback to repository owner: {repo.owner.login}")
                     responsible_users.append(repo.owner.login)
             except Exception as e:
-                print(f"    ⚠️ Could not get repository owner: {e}")
+                log.append(f"    ⚠️ Could not get repository owner: {e}")
         
         # Remove duplicates while preserving order
         unique_users = []
@@ -383,59 +423,57 @@ def get_responsible_users(repo, github_client):
         final_users = unique_users[:3]
         
         if final_users:
-            print(f"    ✅ Final assignees: {', '.join(final_users)}")
+            log.append(f"    ✅ Final assignees: {', '.join(final_users)}")
         else:
-            print(f"    ⚠️ No responsible users found")
+            log.append(f"    ⚠️ No responsible users found")
         
         return final_users
         
+    except RateLimitExceededException:
+        raise
     except Exception as e:
-        print(f"    ❌ Error finding responsible users: {e}")
+        log.append(f"    ❌ Error finding responsible users: {e}")
         return []
+    finally:
+        print('\n'.join(log))
 
-def create_compliance_issues_with_assignment(github_client, org_name, compliance_issues, report):
+def create_compliance_issues_with_assignment(github_client, org_name, compliance_issues, report, repositories_by_name=None,
+                                             scan_time=None):
     """Create tracking issues in admin repository with auto-assignment"""
     try:
         admin_repo = github_client.get_repo(f"{org_name}/admin-repo-compliance")
         
-        # Create or update daily summary issue
-        today = datetime.now().strftime('%Y-%m-%d')
-        summary_title = f"📊 Repository Compliance Report - {today}"
-        
-        summary_body = generate_summary_issue_body(org_name, report)
-        
-        # Check for existing summary issue today
-        existing_issues = list(admin_repo.get_issues(state='open', labels=['compliance-report']))
-        today_issue = None
-        
-        for issue in existing_issues:
-            if today in issue.title:
-                today_issue = issue
-                break
-        
-        if today_issue:
-            today_issue.edit(body=summary_body)
-            print(f"📝 Updated existing compliance report: #{today_issue.number}")
-        else:
-            # Create labels if they don't exist
-            ensure_admin_labels_exist(admin_repo)
-            
-            new_issue = admin_repo.create_issue(
-                title=summary_title,
-                body=summary_body,
-                labels=['compliance-report', 'automated', f'scan-{today}']
-            )
-            print(f"📋 Created compliance report issue: #{new_issue.number}")
+        # Update the single rolling summary issue instead of opening a new one each run
+        upsert_summary_issue(admin_repo, org_name, report)
         
-        # Create individual high-priority issues WITH ASSIGNMENT
-        create_high_priority_issues_with_assignment(github_client, admin_repo, compliance_issues)
+        # Create individual high-priority issues WITH ASSIGNMENT, with the committer window ending at the scan
+        create_high_priority_issues_with_assignment(github_client, admin_repo, compliance_issues, repositories_by_name,
+                                                    scan_time)
         
     except Exception as e:
         print(f"❌ Error creating compliance issues: {e}")
         raise
 
-def create_high_priority_issues_with_assignment(github_client, admin_repo, compliance_issues):
-    """Create individual issues for high-priority violations with auto-assignment"""
+def get_open_high_priority_issues(admin_repo):
+    """
+    List the open high-priority issues once and index them by repository name
+    Returns: dict mapping repository name to its open issue
+    """
+    title_prefix = "🚨 High Priority Compliance - "
+    open_issues = {}
+    
+    for issue in admin_repo.get_issues(state='open', labels=['high-priority-compliance']):
+        if issue.title.startswith(title_prefix):
+            open_issues.setdefault(issue.title[len(title_prefix):], issue)
+    
+    return open_issues
+
+def create_high_priority_issues_with_assignment(github_client, admin_repo, compliance_issues, repositories_by_name=None,
+                                                scan_time=None, max_workers=4):
+    """
+    Create individual issues for high-priority violations with auto-assignment
+    Repositories are processed concurrently; a small pool keeps issue writes under the secondary rate limit
+    """
     high_priority_labels = [
         'missing:readme',
         'missing:gitignore', 
@@ -443,92 +481,166 @@ def create_high_priority_issues_with_assignment(github_client, admin_repo, compl
         'naming:missing-prefix'
     ]
     
-    created_count = 0
-    updated_count = 0
-    assignment_stats = {'assigned': 0, 'no_assignee': 0}
+    try:
+        open_issues = get_open_high_priority_issues(admin_repo)
+    except Exception as e:
+        print(f"❌ Error listing open high-priority issues: {e}")
+        return
+    
+    # Only repositories with high-priority labels get their own issue
+    high_priority_issues = [repo_issue for repo_issue in compliance_issues
+                            if any(label in high_priority_labels for label in repo_issue['labels'])]
     
-    for repo_issue in compliance_issues:
+    def process_one(repo_issue):
+        """
+        Create or update the issue for one repository
+        Returns: (action, assigned) where action is 'created', 'updated' or None
+        """
         repo_name = repo_issue['name']
         repo_url = repo_issue['url']
-        labels = repo_issue['labels']
-        
-        # Check if this repository has high-priority issues
-        has_high_priority = any(label in high_priority_labels for label in labels)
         
-        if has_high_priority:
-            try:
-                # Get the actual repository object for assignment lookup
+        try:
+            throttle_on_low_rate_limit(github_client)
+            
+            # Reuse the scanned repository object for assignment lookup, fetching only if missing
+            target_repo = (repositories_by_name or {}).get(repo_name)
+            if target_repo is None:
                 target_repo = github_client.get_repo(repo_url.replace('https://github.com/', ''))
-                responsible_users = get_responsible_users(target_repo, github_client)
+            # Wait out rate limits hit while looking up assignees, as the scan does
+            for attempt in range(1, 4):
+                try:
+                    responsible_users = get_responsible_users(target_repo, github_client,
+                                                              repo_issue.get('codeowners_path'), scan_time)
+                    break
+                except RateLimitExceededException as e:
+                    if attempt == 3:
+                        raise
+                    print(f"  ⏳ Rate limit exceeded while finding assignees for {repo_name} (attempt {attempt}/3)")
+                    wait_for_rate_limit_reset(github_client, error=e, attempt=attempt)
+            
+            issue_title = f"🚨 High Priority Compliance - {repo_name}"
+            
+            issue_body = generate_high_priority_issue_body(repo_issue, responsible_users)
+            
+            # Check if issue already exists for this repo
+            existing_issue = open_issues.get(repo_name)
+            
+            if existing_issue:
+                # The listing already returned body and assignees, so unchanged issues need no PATCH
+                action = 'unchanged'
+                if existing_issue.body != issue_body:
+                    existing_issue.edit(body=issue_body)
+                    action = 'updated'
+                if not responsible_users:
+                    return action, False
                 
-                issue_title = f"🚨 High Priority Compliance - {repo_name}"
+                try:
+                    # Update assignees
+                    if {assignee.login for assignee in existing_issue.assignees} != set(responsible_users):
+                        existing_issue.edit(assignees=responsible_users)
+                        action = 'updated'
+                    if action == 'updated':
+                        print(f"📝 Updated issue for {repo_name} - assigned to: {', '.join(responsible_users)}")
+                    else:
+                        print(f"ℹ️ Issue for {repo_name} is up to date - assigned to: {', '.join(responsible_users)}")
+                    return action, True
+                except Exception as assign_error:
+                    print(f"⚠️ Could not assign {repo_name} issue: {assign_error}")
+                    return action, False
+            
+            try:
+                # Create new issue with assignment
+                new_issue_params = {
+                    'title': issue_title,
+                    'body': issue_body,
+                    'labels': ['high-priority-compliance', 'automated', repo_name]
+                }
                 
-                issue_body = generate_high_priority_issue_body(repo_issue, responsible_users)
+                if responsible_users:
+                    new_issue_params['assignees'] = responsible_users
                 
-                # Check if issue already exists for this repo
-                existing_issues = list(admin_repo.get_issues(state='open', labels=['high-priority-compliance']))
-                repo_issue_exists = False
+                new_issue = admin_repo.create_issue(**new_issue_params)
                 
-                for existing_issue in existing_issues:
-                    if repo_name in existing_issue.title:
-                        # Update existing issue with new assignees
-                        existing_issue.edit(body=issue_body)
-                        if responsible_users:
-                            try:
-                                # Update assignees
-                                existing_issue.edit(assignees=responsible_users)
-                                print(f"📝 Updated issue for {repo_name} - assigned to: {', '.join(responsible_users)}")
-                                assignment_stats['assigned'] += 1
-                            except Exception as assign_error:
-                                print(f"⚠️ Could not assign {repo_name} issue: {assign_error}")
-                                assignment_stats['no_assignee'] += 1
-                        else:
-                            assignment_stats['no_assignee'] += 1
-                        
-                        updated_count += 1
-                        repo_issue_exists = True
-                        break
+                if responsible_users:
+                    print(f"🚨 Created issue for {repo_name}: #{new_issue.number} - assigned to: {', '.join(responsible_users)}")
+                else:
+                    print(f"🚨 Created issue for {repo_name}: #{new_issue.number} - no assignee found")
                 
-                if not repo_issue_exists:
-                    try:
-                        # Create new issue with assignment
-                        new_issue_params = {
-                            'title': issue_title,
-                            'body': issue_body,
-                            'labels': ['high-priority-compliance', 'automated', repo_name]
-                        }
-                        
-                        if responsible_users:
-                            new_issue_params['assignees'] = responsible_users
-                        
-                        new_issue = admin_repo.create_issue(**new_issue_params)
-                        
-                        if responsible_users:
-                            print(f"🚨 Created issue for {repo_name}: #{new_issue.number} - assigned to: {', '.join(responsible_users)}")
-                            assignment_stats['assigned'] += 1
-                        else:
-                            print(f"🚨 Created issue for {repo_name}: #{new_issue.number} - no assignee found")
-                            assignment_stats['no_assignee'] += 1
-                        
-                        created_count += 1
-                        
-                    except Exception as e:
-                        print(f"❌ Failed to create issue for {repo_name}: {e}")
-                        assignment_stats['no_assignee'] += 1
-                        
-                # Small delay to respect rate limits
-                time.sleep(0.5)
+                return 'created', bool(responsible_users)
                 
             except Exception as e:
-                print(f"❌ Error processing {repo_name}: {e}")
-                assignment_stats['no_assignee'] += 1
-                continue
+                print(f"❌ Failed to create issue for {repo_name}: {e}")
+                return None, False
+            
+        except Exception as e:
+            print(f"❌ Error processing {repo_name}: {e}")
+            return None, False
+    
+    outcomes = Counter()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for action, assigned in executor.map(process_one, high_priority_issues):
+            if action:
+                outcomes[action] += 1
+            outcomes['assigned' if assigned else 'no_assignee'] += 1
     
     print(f"\n📊 Issue Assignment Summary:")
-    print(f"📋 Created: {created_count} new issues")  
-    print(f"📝 Updated: {updated_count} existing issues")
-    print(f"👥 Successfully assigned: {assignment_stats['assigned']} issues")
-    print(f"⚠️ No assignee found: {assignment_stats['no_assignee']} issues")
+    print(f"📋 Created: {outcomes['created']} new issues")  
+    print(f"📝 Updated: {outcomes['updated']} existing issues")
+    print(f"ℹ️ Unchanged: {outcomes['unchanged']} existing issues")
+    print(f"👥 Successfully assigned: {outcomes['assigned']} issues")
+    print(f"⚠️ No assignee found: {outcomes['no_assignee']} issues")
+
+# Fix instructions added to high-priority issues, in order, for each label the repository carries
+FIX_INSTRUCTIONS = {
+    'naming:missing-prefix': """
+#### Fix Naming Convention
+```bash
+# Rename repository to include required prefix
+gh repo rename {repo_name} {org_prefix}{repo_name}
+```
+""",
+    'missing:readme': """
+#### Add README
+```bash
+cat > README.md << 'EOF'
+# {repo_name}
+
+## Description
+Brief description of this repository's purpose.
+
+## Usage
+Instructions for using this repository.
+
+## Contributing
+Guidelines for contributing to this project.
+EOF
+
+git add README.md
+git commit -m "Add README file for compliance"
+git push
+```
+""",
+    'missing:gitignore': """
+#### Add .gitignore
+```bash
+# Create appropriate .gitignore for your technology stack
+curl -o .gitignore https://raw.githubusercontent.com/github/gitignore/main/Global/VisualStudioCode.gitignore
+
+git add .gitignore
+git commit -m "Add .gitignore file for compliance"
+git push
+```
+""",
+    'security:no-branch-protection': """
+#### Enable Branch Protection
+1. Go to repository Settings → Branches
+2. Click "Add rule" for the default branch
+3. Enable:
+   - ✅ Require pull request reviews before merging
+   - ✅ Require status checks to pass before merging
+   - ✅ Restrict pushes that create files larger than 100MB
+""",
+}
 
 def generate_high_priority_issue_body(repo_issue, responsible_users):
     """Generate issue body with assignment information"""
@@ -536,46 +648,47 @@ def generate_high_priority_issue_body(repo_issue, responsible_users):
     repo_url = repo_issue['url']
     labels = repo_issue['labels']
     
-    issue_body = f"""# 🚨 High Priority Compliance Issues
+    parts = [f"""# 🚨 High Priority Compliance Issues
 
 **Repository:** [{repo_name}]({repo_url})  
 **Priority:** High  
 **Visibility:** {repo_issue['visibility']}  
 **Last Updated:** {repo_issue['last_push'] or 'Never'}
 
-"""
+"""]
     
     # Add assignment information
     if responsible_users:
-        issue_body += f"""## 👥 Assigned To
+        parts.append(f"""## 👥 Assigned To
 This issue has been automatically assigned to the following responsible parties:
 
-"""
+""")
         for user in responsible_users:
-            issue_body += f"- @{user}\n"
+            parts.append(f"- @{user}\n")
         
-        issue_body += f"""
+        parts.append(f"""
 **Why these assignees?** Based on repository permissions, CODEOWNERS, and recent activity.
 
-"""
+""")
     else:
-        issue_body += f"""## ⚠️ No Assignee Found
+        parts.append(f"""## ⚠️ No Assignee Found
 This issue could not be automatically assigned. Please:
 1. Ensure the repository has designated admins or maintainers
 2. Consider adding a CODEOWNERS file
 3. Manually assign this issue to the appropriate team member
 
-"""
+""")
     
-    issue_body += f"""## 🔍 Issues Found
+    parts.append(f"""## 🔍 Issues Found
 
-"""
+""")
     
     critical_count = 0
     high_priority_labels = ['missing:readme', 'security:no-branch-protection']
     
-    for i, violation in enumerate(repo_issue['violations'], 1):
-        label = labels[min(i-1, len(labels)-1)] if labels else ""
+    # Pair each violation with its label, reusing the last label once they run out
+    paired_labels = chain(labels, repeat(labels[-1] if labels else ""))
+    for i, (violation, label) in enumerate(zip(repo_issue['violations'], paired_labels), 1):
         if label in ['missing:readme', 'security:no-branch-protection']:
             priority_icon = "🔴 CRITICAL"
             critical_count += 1
@@ -584,10 +697,10 @@ This issue could not be automatically assigned. Please:
         else:
             priority_icon = "🟡 MEDIUM"
         
-        issue_body += f"{i}. {priority_icon} {violation}\n"
+        parts.append(f"{i}. {priority_icon} {violation}\n")
     
     # Add fix instructions based on violations
-    issue_body += f"""
+    parts.append(f"""
 
 ## 🛠️ Fix Instructions
 
@@ -598,87 +711,35 @@ git clone {repo_url}
 cd {repo_name}
 ```
 
-"""
+""")
     
     # Add specific fix instructions based on violations
-    if 'naming:missing-prefix' in labels:
-        org_prefix = "FD-" if "finastra" in repo_url.lower() else "t-"
-        issue_body += f"""
-#### Fix Naming Convention
-```bash
-# Rename repository to include required prefix
-gh repo rename {repo_name} {org_prefix}{repo_name}
-```
-"""
-    
-    if 'missing:readme' in labels:
-        issue_body += f"""
-#### Add README
-```bash
-cat > README.md << 'EOF'
-# {repo_name}
-
-## Description
-Brief description of this repository's purpose.
-
-## Usage
-Instructions for using this repository.
-
-## Contributing
-Guidelines for contributing to this project.
-EOF
-
-git add README.md
-git commit -m "Add README file for compliance"
-git push
-```
-"""
-    
-    if 'missing:gitignore' in labels:
-        issue_body += f"""
-#### Add .gitignore
-```bash
-# Create appropriate .gitignore for your technology stack
-curl -o .gitignore https://raw.githubusercontent.com/github/gitignore/main/Global/VisualStudioCode.gitignore
-
-git add .gitignore
-git commit -m "Add .gitignore file for compliance"
-git push
-```
-"""
-    
-    if 'security:no-branch-protection' in labels:
-        issue_body += f"""
-#### Enable Branch Protection
-1. Go to repository Settings → Branches
-2. Click "Add rule" for the default branch
-3. Enable:
-   - ✅ Require pull request reviews before merging
-   - ✅ Require status checks to pass before merging
-   - ✅ Restrict pushes that create files larger than 100MB
-"""
+    org_prefix = "FD-" if "finastra" in repo_url.lower() else "t-"
+    for label, instructions in FIX_INSTRUCTIONS.items():
+        if label in labels:
+            parts.append(instructions.format(repo_name=repo_name, org_prefix=org_prefix))
     
-    issue_body += f"""
+    parts.append(f"""
 
 ## ✅ Completion Checklist
-"""
+""")
     
     for violation in repo_issue['violations']:
-        issue_body += f"- [ ] {violation}\n"
+        parts.append(f"- [ ] {violation}\n")
     
-    issue_body += f"""
+    parts.append(f"""
 
 ## 🏷️ Applied Labels
-{', '.join([f'`{label}`' for label in labels])}
+{', '.join(f'`{label}`' for label in labels)}
 
 ## 🔄 Re-run Compliance Check
 After making fixes, the compliance checker will automatically re-run tomorrow, or you can trigger it manually from the Actions tab.
 
 ---
 *This issue was automatically created and assigned by the Repository Compliance Checker*
-"""
+""")
     
-    return issue_body
+    return ''.join(parts)
 
 # All remaining functions from original script (keeping existing implementations)
 
@@ -696,9 +757,9 @@ def validate_token_permissions(github_client, org_name, is_github_actions=False)
             org = github_client.get_organization(org_name)
             print(f"🏢 Organization access: ✅ {org.login}")
             
-            # Try to get a small sample of repositories
+            # Try to get a small sample of repositories (first page only, not the full listing)
             try:
-                repos_sample = list(org.get_repos(type='all'))[:3]
+                repos_sample = org.get_repos(type='all').get_page(0)[:3]
                 print(f"📊 Repository access: ✅ Can see {len(repos_sample)} repositories")
                 
                 # Show sample repo names
@@ -730,7 +791,80 @@ def validate_token_permissions(github_client, org_name, is_github_actions=False)
         print(f"❌ Token validation failed: {e}")
         raise
 
-def get_all_repositories_optimized(github_client, org, org_name, is_github_actions=False):
+def create_retrying_session(total=5):
+    """
+    requests session that retries connection errors and 5xx responses with exponential backoff
+    Matches the retries PyGithub gets from GITHUB_RETRY for calls made outside the client
+    """
+    retry = Retry(total=total, backoff_factor=1, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(max_retries=retry))
+    return session
+
+def list_organization_repositories(github_client, token, org_name, etag_cache=None, max_pages=100):
+    """
+    List organization repositories using conditional requests
+    Pages unchanged since the last run return 304 Not Modified, which GitHub does not count against the rate limit
+    A page that still fails after retries raises (RuntimeError after the first page), so callers never get a truncated list
+    Returns: list of PyGithub Repository objects
+    """
+    repositories = []
+    url = f"https://api.github.com/orgs/{org_name}/repos?type=all&per_page=100"
+    headers = {'Authorization': f'token {token}', 'Accept': 'application/vnd.github+json'}
+    page = 0
+    not_modified = 0
+    attempt = 1
+    
+    with create_retrying_session() as session:
+        while url:
+            cached = etag_cache.get(url) if etag_cache is not None else None
+            request_headers = dict(headers, **({'If-None-Match': cached['etag']} if cached else {}))
+            
+            try:
+                response = session.get(url, headers=request_headers, timeout=60)
+                
+                # Rate limited: wait for the reset (or retry-after) and request the same page again
+                rate_limited = (response.status_code in (403, 429) and
+                                ('retry-after' in response.headers or response.headers.get('x-ratelimit-remaining') == '0'))
+                if rate_limited and attempt < 3:
+                    wait_for_rate_limit_reset(github_client, error=response, attempt=attempt)
+                    attempt += 1
+                    continue
+                
+                if response.status_code == 304 and cached:
+                    page_data, next_url = cached['data'], cached['next']
+                    not_modified += 1
+                else:
+                    response.raise_for_status()
+                    page_data = response.json()
+                    next_url = response.links.get('next', {}).get('url')
+                    if etag_cache is not None and response.headers.get('ETag'):
+                        etag_cache[url] = {'etag': response.headers['ETag'], 'data': page_data, 'next': next_url}
+                        
+            except Exception as e:
+                print(f"   ❌ Error on page {page + 1}: {e}")
+                if page == 0:
+                    raise
+                # Later pages failing would leave a partial list; abort instead of scanning a subset
+                raise RuntimeError(f"Repository listing failed on page {page + 1} after retries") from e
+            
+            repositories.extend(github_client.create_from_raw_data(Repository, raw_repo) for raw_repo in page_data)
+            page += 1
+            attempt = 1
+            print(f"   📄 Page {page}: {len(page_data)} repositories")
+            url = next_url
+            
+            # GitHub Actions has time limits, so add reasonable pagination limit
+            if url and page >= max_pages:
+                print(f"   ⚠️ Reached pagination limit ({max_pages} pages)")
+                break
+    
+    if not_modified:
+        print(f"   💾 {not_modified}/{page} pages unchanged since last run (304 Not Modified)")
+    
+    return repositories
+
+def get_all_repositories_optimized(github_client, token, org_name, is_github_actions=False, etag_cache=None):
     """Optimized repository discovery for GitHub Actions environment"""
     print(f"🔍 Fetching repositories from {org_name}...")
     
@@ -740,33 +874,15 @@ def get_all_repositories_optimized(github_client, org, org_name, is_github_actio
     try:
         print(f"🔄 Method 1: Organization repository access...")
         
-        # Get all repositories with pagination
-        repos = []
-        page = 0
-        
-        while True:
-            try:
-                page_repos = org.get_repos(type='all', sort='updated').get_page(page)
-                if not page_repos:
-                    break
-                
-                repos.extend(page_repos)
-                print(f"   📄 Page {page + 1}: {len(page_repos)} repositories")
-                
-                page += 1
-                
-                # GitHub Actions has time limits, so add reasonable pagination limit
-                if page > 100:  # Max 3000 repos (30 per page default)
-                    print(f"   ⚠️ Reached pagination limit (100 pages)")
-                    break
-                    
-            except Exception as e:
-                print(f"   ❌ Error on page {page + 1}: {e}")
-                break
+        # Get all repositories with conditional pagination
+        repos = list_organization_repositories(github_client, token, org_name, etag_cache)
         
         repositories = repos
         print(f"✅ Method 1 successful: {len(repositories)} repositories")
         
+    except RuntimeError:
+        # Listing broke off partway; the fallback would also scan a subset, so stop the run
+        raise
     except Exception as e:
         print(f"❌ Method 1 failed: {e}")
         
@@ -798,30 +914,290 @@ def get_all_repositories_optimized(github_client, org, org_name, is_github_actio
     
     return repositories
 
+def scan_repositories(github_client, repositories, compliance_rules, max_workers=16,
+                      repository_metadata=None, file_cache=None, scan_time=None):
+    """
+    Check repositories concurrently with a bounded thread pool, reporting progress as scans finish
+    Returns: list of (repo, issues) tuples in discovery order, issues is None for failed scans
+    """
+    total_repos = len(repositories)
+    repository_metadata = repository_metadata or {}
+
+    def scan_one(index, repo):
+        try:
+            # With GraphQL metadata few REST calls are made, so the header count is refreshed per batch
+            throttle_on_low_rate_limit(github_client, refresh=index % RATE_LIMIT_REFRESH_EVERY == 0)
+            return check_repository_with_backoff(github_client, repo, compliance_rules,
+                                                 repository_metadata.get(repo.name), file_cache, scan_time)
+        except Exception as e:
+            print(f"❌ Error scanning {repo.name}: {e}")
+            return None
+
+    results = [None] * total_repos
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(scan_one, index, repo): index for index, repo in enumerate(repositories)}
+
+        for completed, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            repo = repositories[index]
+            issues = future.result()
+            results[index] = (repo, issues)
+
+            if issues is None:
+                continue
+            if issues['violations']:
+                print(f"❌ ({completed}/{total_repos}) Found {len(issues['violations'])} issues in {repo.name}")
+            else:
+                print(f"✅ ({completed}/{total_repos}) {repo.name} is compliant")
+
+    return results
+
+def check_repository_with_backoff(github_client, repo, rules, metadata=None, file_cache=None, scan_time=None,
+                                  max_attempts=3):
+    """Check a repository, waiting out primary and secondary rate limits between attempts"""
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return check_repository_compliance(repo, rules, metadata, file_cache, scan_time)
+        except RateLimitExceededException as e:
+            if attempt == max_attempts:
+                raise
+            print(f"  ⏳ Rate limit exceeded while checking {repo.name} (attempt {attempt}/{max_attempts})")
+            wait_for_rate_limit_reset(github_client, error=e, attempt=attempt)
+
+# Repositories scanned between fresh reads of the core rate limit in throttle_on_low_rate_limit
+RATE_LIMIT_REFRESH_EVERY = 50
+
+def throttle_on_low_rate_limit(github_client, threshold=50, max_wait=3600, refresh=False):
+    """
+    Pause until the core rate limit resets when few requests are left
+    Normally reads the headers of the most recent REST response; refresh=True asks /rate_limit instead,
+    which is free and stays current when few REST calls have been made (e.g. on the GraphQL path)
+    """
+    try:
+        if refresh:
+            rate_limit = github_client.get_rate_limit()
+            core = getattr(rate_limit, 'core', None) or rate_limit.rate  # Older PyGithub versions
+            reset = core.reset if core.reset.tzinfo else core.reset.replace(tzinfo=timezone.utc)
+            remaining, reset_time = core.remaining, reset.timestamp()
+        else:
+            remaining, _ = github_client.rate_limiting
+            reset_time = None
+        if remaining < 0 or remaining >= threshold:
+            return
+        if reset_time is None:
+            reset_time = github_client.rate_limiting_resettime
+    except Exception as e:
+        print(f"  ⚠️ Could not read rate limit status: {e}")
+        return
+    
+    wait_seconds = min(max(reset_time - time.time(), 0) + 1, max_wait)
+    print(f"  🕒 Only {remaining} API requests left, pausing {wait_seconds:.0f}s for rate limit reset...")
+    time.sleep(wait_seconds)
+
+def get_rate_limit_wait(github_client, error=None, attempt=1):
+    """
+    Work out how long to wait after a rate limit error
+    Secondary limits honour retry-after or back off exponentially, primary limits wait for the reset
+    Returns: seconds to wait
+    """
+    headers = {key.lower(): value for key, value in (getattr(error, 'headers', None) or {}).items()}
+    
+    if 'retry-after' in headers:
+        return int(headers['retry-after']) + 1
+    
+    if headers.get('x-ratelimit-remaining') == '0' and 'x-ratelimit-reset' in headers:
+        return max(int(headers['x-ratelimit-reset']) - time.time(), 0) + 1
+    
+    if headers:
+        # Secondary rate limit without retry-after: GitHub asks for at least a minute, growing per attempt
+        return 60 * 2 ** (attempt - 1) + random.uniform(0, 10)
+    
+    rate_limit = github_client.get_rate_limit()
+    try:
+        reset_time = rate_limit.core.reset
+    except AttributeError:
+        # Fallback for older PyGithub versions
+        reset_time = rate_limit.rate.reset
+
+    # Older PyGithub versions return naive UTC datetimes
+    if reset_time.tzinfo is None:
+        reset_time = reset_time.replace(tzinfo=timezone.utc)
+
+    return max((reset_time - datetime.now(timezone.utc)).total_seconds(), 0) + 1
+
+def wait_for_rate_limit_reset(github_client, max_wait=3600, error=None, attempt=1):
+    """Sleep until the rate limit that caused error should have lifted"""
+    try:
+        wait_seconds = get_rate_limit_wait(github_client, error, attempt)
+    except Exception as e:
+        print(f"  ⚠️ Could not read rate limit reset time: {e}")
+        wait_seconds = 60
+
+    wait_seconds = min(wait_seconds, max_wait)
+    print(f"  🕒 Waiting {wait_seconds:.0f}s for rate limit reset...")
+    time.sleep(wait_seconds)
+
+REPOSITORY_METADATA_QUERY = """
+query($org: String!, $cursor: String, $pageSize: Int!) {
+  organization(login: $org) {
+    repositories(first: $pageSize, after: $cursor) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        defaultBranchRef { branchProtectionRule { requiresStatusChecks } }
+        repositoryTopics(first: 1) { totalCount }
+        root: object(expression: "HEAD:") {
+          ... on Tree { entries { name type object { ... on Blob { byteSize } } } }
+        }
+        dotGithub: object(expression: "HEAD:.github") { ... on Tree { entries { name } } }
+        docs: object(expression: "HEAD:docs") { ... on Tree { entries { name } } }
+      }
+    }
+  }
+}
+"""
+
+def fetch_repository_metadata(token, org_name, page_size=100):
+    """
+    Fetch compliance metadata for all organization repositories via GraphQL
+    One request covers page_size repositories instead of several REST calls per repository
+    Returns: dict mapping repository name to metadata (repositories missing from it use REST checks)
+    """
+    print(f"🔍 Fetching repository metadata via GraphQL...")
+    
+    metadata = {}
+    cursor = None
+    page = 0
+    
+    try:
+        while True:
+            response = requests.post(
+                'https://api.github.com/graphql',
+                json={
+                    'query': REPOSITORY_METADATA_QUERY,
+                    'variables': {'org': org_name, 'cursor': cursor, 'pageSize': page_size}
+                },
+                headers={'Authorization': f'bearer {token}'},
+                timeout=60
+            )
+            response.raise_for_status()
+            payload = response.json()
+            
+            # Nodes named in an error path may have fields nulled by that error, so they use REST instead
+            failed_nodes = get_failed_node_indexes(payload.get('errors') or [])
+            if payload.get('errors'):
+                print(f"   ⚠️ GraphQL errors ({len(payload['errors'])}): "
+                      f"{payload['errors'][0].get('message', 'unknown error')}")
+            
+            organization = (payload.get('data') or {}).get('organization')
+            if not organization:
+                break
+            
+            repositories = organization['repositories']
+            for index, node in enumerate(repositories['nodes']):
+                if not node or failed_nodes is None or index in failed_nodes:
+                    continue
+                node_metadata = parse_repository_metadata(node)
+                if node_metadata is not None:
+                    metadata[node['name']] = node_metadata
+            
+            page += 1
+            print(f"   📄 Page {page}: {len(repositories['nodes'])} repositories")
+            
+            if not repositories['pageInfo']['hasNextPage']:
+                break
+            cursor = repositories['pageInfo']['endCursor']
+            
+    except Exception as e:
+        print(f"⚠️ GraphQL metadata fetch failed: {e}")
+        print(f"ℹ️ Remaining repositories will be checked via REST")
+    
+    return metadata
+
+def get_failed_node_indexes(errors):
+    """
+    Find the repository nodes affected by GraphQL errors from each error's path
+    Returns: set of node indexes, or None when an error cannot be tied to a node (the whole page is unreliable)
+    """
+    failed_nodes = set()
+    for error in errors:
+        path = error.get('path') or []
+        if len(path) > 3 and path[:3] == ['organization', 'repositories', 'nodes'] and isinstance(path[3], int):
+            failed_nodes.add(path[3])
+        else:
+            return None
+    return failed_nodes
+
+def parse_repository_metadata(node):
+    """
+    Normalize a GraphQL repository node into the structure consumed by the checks
+    Returns: metadata dict, or None when the root tree is missing for a repository that has a default branch
+    """
+    # A null root only means "no files" for an empty repository, which has no default branch either
+    if node.get('root') is None and node.get('defaultBranchRef') is not None:
+        return None
+    
+    root_files = {}
+    for entry in (node.get('root') or {}).get('entries', []):
+        if entry['type'] == 'blob':
+            root_files[entry['name']] = (entry.get('object') or {}).get('byteSize')
+    
+    directory_files = {}
+    for directory, alias in [('.github', 'dotGithub'), ('docs', 'docs')]:
+        entries = (node.get(alias) or {}).get('entries', [])
+        directory_files[directory] = {entry['name'] for entry in entries}
+    
+    return {
+        'root_files': root_files,
+        'directory_files': directory_files,
+        'protection_rule': (node.get('defaultBranchRef') or {}).get('branchProtectionRule'),
+        'topic_count': node['repositoryTopics']['totalCount']
+    }
+
+# Naming rules per organization; get_compliance_rules adds the compiled checks
+FINASTRA_RULES = {
+    'required_prefixes': ('FD-',),
+    'naming_pattern': r'^FD-[a-z0-9]+-[a-z0-9-]+$',
+    'description': 'Finastra Demo organization rules - all repos must start with FD-'
+}
+
+ARCTIQ_RULES = {
+    'required_prefixes': ('a-', 'e-', 't-', 'p-', 'action-', 'collab-'),
+    'naming_pattern': r'^(a|e|t|p|action|collab)-[a-z0-9]+-[a-z0-9-]+$',
+    'description': 'Arctiq Team organization rules - prefixed naming convention'
+}
+
+# Generic rules for other organizations
+GENERIC_RULES = {
+    'required_prefixes': ('a-', 'e-', 't-', 'p-'),
+    'naming_pattern': r'^[a-z]+-[a-z0-9]+-[a-z0-9-]+$',
+    'description': 'Generic organization rules - standard prefixed naming'
+}
+
 def get_compliance_rules(org_name):
-    """Get compliance rules based on organization"""
+    """Get compliance rules based on organization, with naming checks prepared once per run"""
     if org_name == 'finastra-demo':
-        return {
-            'required_prefix': 'FD-',
-            'naming_pattern': r'^FD-[a-z0-9]+-[a-z0-9-]+$',
-            'description': 'Finastra Demo organization rules - all repos must start with FD-'
-        }
+        rules = dict(FINASTRA_RULES)
     elif org_name.lower() in ['arctiqteam', 'arctiq-team']:
-        return {
-            'required_prefixes': ['a-', 'e-', 't-', 'p-', 'action-', 'collab-'],
-            'naming_pattern': r'^(a|e|t|p|action|collab)-[a-z0-9]+-[a-z0-9-]+$',
-            'description': 'Arctiq Team organization rules - prefixed naming convention'
-        }
+        rules = dict(ARCTIQ_RULES)
     else:
-        # Generic rules for other organizations
-        return {
-            'required_prefixes': ['a-', 'e-', 't-', 'p-'],
-            'naming_pattern': r'^[a-z]+-[a-z0-9]+-[a-z0-9-]+$',
-            'description': 'Generic organization rules - standard prefixed naming'
-        }
+        rules = dict(GENERIC_RULES)
+    
+    # Compile the pattern and build the prefix message here rather than per repository
+    required_prefixes = rules['required_prefixes']
+    if len(required_prefixes) == 1:
+        rules['prefix_violation'] = f'Repository name must start with "{required_prefixes[0]}"'
+    else:
+        rules['prefix_violation'] = f'Repository name must start with one of: {", ".join(required_prefixes)}'
+    rules['naming_regex'] = re.compile(rules['naming_pattern'], re.IGNORECASE)
+    
+    return rules
 
-def check_repository_compliance(repo, rules):
-    """Check a single repository for compliance issues"""
+def check_repository_compliance(repo, rules, metadata=None, file_cache=None, scan_time=None):
+    """
+    Check a single repository for compliance issues
+    With GraphQL metadata the checks run without further API calls, otherwise REST is used
+    """
     issues = {
         'name': repo.name,
         'url': repo.html_url,
@@ -845,120 +1221,193 @@ def check_repository_compliance(repo, rules):
     check_naming_convention(repo, rules, issues)
     
     # Check 2: Required Files
-    check_required_files(repo, issues)
+    check_required_files(repo, issues, metadata, file_cache)
     
-    # Check 3: Branch Protection
-    check_branch_protection(repo, issues)
+    # Check 3: Branch Protection - skipped for repositories untouched for over a year,
+    # which are already flagged as inactive and may otherwise need REST calls to confirm
+    days_since_push = get_days_since_push(repo, scan_time)
+    if days_since_push is None or days_since_push <= INACTIVE_DAYS:
+        check_branch_protection(repo, issues, metadata)
     
     # Check 4: Repository Description
     check_repository_description(repo, issues)
     
     # Check 5: Activity Status
-    check_activity_status(repo, issues)
+    check_activity_status(repo, issues, scan_time)
     
     # Check 6: Repository Size and Quality
-    check_repository_quality(repo, issues)
+    check_repository_quality(repo, issues, metadata)
     
     return issues
 
 def check_naming_convention(repo, rules, issues):
     """Check repository naming convention"""
     try:
-        if 'required_prefix' in rules:
-            # Single prefix requirement (e.g., Finastra-demo)
-            required_prefix = rules['required_prefix']
-            if not repo.name.startswith(required_prefix):
-                issues['violations'].append(f'Repository name must start with "{required_prefix}"')
-                issues['labels'].append('naming:missing-prefix')
-        elif 'required_prefixes' in rules:
-            # Multiple prefix options (e.g., Arctiq)
-            required_prefixes = rules['required_prefixes']
-            if not any(repo.name.startswith(prefix) for prefix in required_prefixes):
-                issues['violations'].append(f'Repository name must start with one of: {", ".join(required_prefixes)}')
-                issues['labels'].append('naming:missing-prefix')
-        
-        # Check naming pattern if defined
-        if 'naming_pattern' in rules:
-            pattern = rules['naming_pattern']
-            if not re.match(pattern, repo.name, re.IGNORECASE):
-                issues['violations'].append('Repository name does not follow naming pattern')
-                issues['labels'].append('naming:non-compliant')
+        # str.startswith accepts the tuple of allowed prefixes directly
+        if not repo.name.startswith(rules['required_prefixes']):
+            issues['violations'].append(rules['prefix_violation'])
+            issues['labels'].append('naming:missing-prefix')
+        
+        # Check naming pattern
+        if not rules['naming_regex'].match(repo.name):
+            issues['violations'].append('Repository name does not follow naming pattern')
+            issues['labels'].append('naming:non-compliant')
                 
     except Exception as e:
         print(f"⚠️ Error checking naming for {repo.name}: {e}")
 
-def check_required_files(repo, issues):
-    """Check for required files in repository"""
+# File names checked in the repository root, in order of preference
+README_FILES = ('README.md', 'README.rst', 'README.txt', 'readme.md', 'Readme.md')
+LICENSE_FILES = ('LICENSE', 'LICENSE.md', 'LICENSE.txt', 'license', 'License')
+
+# Directories besides the root where GitHub looks for CODEOWNERS
+CODEOWNERS_DIRECTORIES = ('.github', 'docs')
+# (directory, path) pairs in GitHub's CODEOWNERS lookup order; '' is the repository root
+CODEOWNERS_LOCATIONS = (('.github', '.github/CODEOWNERS'), ('', 'CODEOWNERS'), ('docs', 'docs/CODEOWNERS'))
+
+def get_repository_tree(repo, tree_sha):
+    """
+    List the entries of a single (non-recursive) git tree
+    Returns: (files, directories) dicts mapping entry name to blob size and tree SHA
+    """
+    files = {}
+    directories = {}
+
     try:
-        # Check for README
-        readme_found = False
-        readme_files = ['README.md', 'README.rst', 'README.txt', 'readme.md', 'Readme.md']
-        
-        for readme_name in readme_files:
-            try:
-                readme = repo.get_contents(readme_name)
-                readme_content = readme.decoded_content.decode('utf-8', errors='ignore')
-                if len(readme_content) >= 100:
-                    readme_found = True
-                    break
-                else:
-                    issues['violations'].append(f'{readme_name} file is too short (< 100 characters)')
-                    issues['labels'].append('missing:readme')
-                    break
-            except:
-                continue
+        tree = repo.get_git_tree(tree_sha)
+    except RateLimitExceededException:
+        raise
+    except GithubException as e:
+        # 404: missing branch/tree, 409: empty repository
+        if e.status in (404, 409):
+            return files, directories
+        raise
+
+    for entry in tree.tree:
+        if entry.type == 'blob':
+            files[entry.path] = entry.size
+        elif entry.type == 'tree':
+            directories[entry.path] = entry.sha
+
+    return files, directories
+
+def get_repository_files(repo):
+    """
+    List the files relevant to compliance via the git tree API
+    Subdirectories are only listed when CODEOWNERS is not found at the root
+    Returns: dict with the same file fields as the GraphQL metadata
+    """
+    root_files, root_directories = get_repository_tree(repo, repo.default_branch)
+    directory_files = {directory: set() for directory in CODEOWNERS_DIRECTORIES}
+    codeowners_found = 'CODEOWNERS' in root_files
+    
+    for directory in directory_files:
+        if codeowners_found:
+            break
+        if directory in root_directories:
+            files, _ = get_repository_tree(repo, root_directories[directory])
+            directory_files[directory] = set(files)
+            codeowners_found = 'CODEOWNERS' in files
+    
+    return {'root_files': root_files, 'directory_files': directory_files}
+
+def get_cached_repository_files(repo, file_cache):
+    """Return the repository file listing, reusing the cached one if nothing was pushed since"""
+    cache_key = (repo.pushed_at.isoformat() if repo.pushed_at else None, repo.default_branch)
+    cached = file_cache.get(repo.full_name)
+    
+    if cached and cached['key'] == cache_key:
+        return cached['files']
+    
+    files = get_repository_files(repo)
+    file_cache[repo.full_name] = {'key': cache_key, 'files': files}
+    return files
+
+def load_shelve_cache(cache_path, description):
+    """Load entries cached by the previous run from a shelve file"""
+    if not cache_path:
+        return None
+    
+    try:
+        with shelve.open(cache_path) as cache:
+            entries = dict(cache)
+        print(f"💾 Loaded {len(entries)} cached {description} from {cache_path}")
+        return entries
+    except Exception as e:
+        print(f"⚠️ Could not load {description} cache {cache_path}: {e}")
+        return {}
+
+def save_shelve_cache(cache_path, entries, description, keep_keys=None):
+    """Persist cache entries to a shelve file, optionally keeping only keep_keys"""
+    if not cache_path or entries is None:
+        return
+    
+    try:
+        with shelve.open(cache_path, flag='n') as cache:
+            for key, entry in entries.items():
+                if keep_keys is None or key in keep_keys:
+                    cache[key] = entry
+        print(f"💾 Saved {description} cache to {cache_path}")
+    except Exception as e:
+        print(f"⚠️ Could not save {description} cache {cache_path}: {e}")
+
+def check_required_files(repo, issues, metadata=None, file_cache=None):
+    """Check for required files in repository using prefetched or tree-based file listings"""
+    try:
+        if metadata is None:
+            if file_cache is not None:
+                metadata = get_cached_repository_files(repo, file_cache)
+            else:
+                metadata = get_repository_files(repo)
+        root_files = metadata['root_files']
+
+        # Check for README - the tree entry size avoids downloading the blob
+        readme_name = next((name for name in README_FILES if name in root_files), None)
         
-        if not readme_found and not any(label.startswith('missing:readme') for label in issues['labels']):
+        if readme_name is None:
             issues['violations'].append('No README file found')
             issues['labels'].append('missing:readme')
+        elif (root_files[readme_name] or 0) < 100:
+            issues['violations'].append(f'{readme_name} file is too short (< 100 characters)')
+            issues['labels'].append('missing:readme')
         
         # Check for .gitignore
-        try:
-            repo.get_contents('.gitignore')
-        except:
+        if '.gitignore' not in root_files:
             issues['violations'].append('No .gitignore file found')
             issues['labels'].append('missing:gitignore')
         
         # Check for LICENSE (public repos only)
         if not repo.private:
-            license_found = False
-            license_files = ['LICENSE', 'LICENSE.md', 'LICENSE.txt', 'license', 'License']
-            
-            for license_name in license_files:
-                try:
-                    repo.get_contents(license_name)
-                    license_found = True
-                    break
-                except:
-                    continue
-            
-            if not license_found:
+            if not any(license_name in root_files for license_name in LICENSE_FILES):
                 issues['violations'].append('No LICENSE file found (required for public repositories)')
                 issues['labels'].append('missing:license')
         
-        # Check for CODEOWNERS
-        codeowners_found = False
-        codeowners_locations = ['CODEOWNERS', '.github/CODEOWNERS', 'docs/CODEOWNERS']
-        
-        for location in codeowners_locations:
-            try:
-                repo.get_contents(location)
-                codeowners_found = True
-                break
-            except:
-                continue
+        # Check for CODEOWNERS, recording where it is so issue assignment can read it directly
+        files_by_directory = {'': root_files, **metadata['directory_files']}
+        codeowners_path = next((path for directory, path in CODEOWNERS_LOCATIONS
+                                if 'CODEOWNERS' in files_by_directory[directory]), None)
+        issues['codeowners_path'] = codeowners_path
         
-        if not codeowners_found:
+        if codeowners_path is None:
             issues['violations'].append('No CODEOWNERS file found')
             issues['labels'].append('missing:codeowners')
                 
+    except RateLimitExceededException:
+        raise
     except Exception as e:
         print(f"⚠️ Error checking files for {repo.name}: {e}")
 
-def check_branch_protection(repo, issues):
+def check_branch_protection(repo, issues, metadata=None):
     """Check branch protection settings"""
     try:
-        if repo.default_branch:
+        # GraphQL only returns classic protection rules visible to the token;
+        # a missing rule may still be a ruleset, so that case is confirmed via REST
+        protection_rule = (metadata or {}).get('protection_rule')
+        if protection_rule is not None:
+            if not protection_rule.get('requiresStatusChecks'):
+                issues['violations'].append('Branch protection lacks required status checks')
+                issues['labels'].append('security:insufficient-protection')
+        elif repo.default_branch:
             try:
                 default_branch = repo.get_branch(repo.default_branch)
                 if not default_branch.protected:
@@ -971,13 +1420,19 @@ def check_branch_protection(repo, issues):
                         if not protection.required_status_checks:
                             issues['violations'].append('Branch protection lacks required status checks')
                             issues['labels'].append('security:insufficient-protection')
-                    except:
+                    except RateLimitExceededException:
+                        raise
+                    except GithubException:
                         # Protection exists but details not accessible
                         pass
+            except RateLimitExceededException:
+                raise
             except Exception:
                 issues['violations'].append(f'Cannot access default branch: {repo.default_branch}')
                 issues['labels'].append('security:branch-access-error')
                 
+    except RateLimitExceededException:
+        raise
     except Exception as e:
         print(f"⚠️ Error checking branch protection for {repo.name}: {e}")
 
@@ -991,24 +1446,37 @@ def check_repository_description(repo, issues):
     except Exception as e:
         print(f"⚠️ Error checking description for {repo.name}: {e}")
 
-def check_activity_status(repo, issues):
-    """Check repository activity status"""
+# Days without a push before a repository is reported as stale or inactive
+STALE_DAYS = 180
+INACTIVE_DAYS = 365
+
+def get_days_since_push(repo, scan_time=None):
+    """
+    Days between the last push and the scan timestamp
+    Returns: number of days, or None if the repository has never been pushed to
+    """
+    if not repo.pushed_at:
+        return None
+    
+    # Calculate days since last push using timezone-aware UTC
+    now = scan_time or datetime.now(timezone.utc)
+    pushed_at = repo.pushed_at
+    
+    # Older PyGithub versions return naive UTC datetimes
+    if pushed_at.tzinfo is None:
+        pushed_at = pushed_at.replace(tzinfo=timezone.utc)
+    
+    return (now - pushed_at).days
+
+def check_activity_status(repo, issues, scan_time=None):
+    """Check repository activity status against the scan timestamp"""
     try:
-        if repo.pushed_at:
-            # Calculate days since last push using UTC
-            now = datetime.utcnow()
-            pushed_at = repo.pushed_at
-            
-            # Handle timezone-aware datetime by converting to naive UTC
-            if hasattr(pushed_at, 'tzinfo') and pushed_at.tzinfo is not None:
-                pushed_at = pushed_at.replace(tzinfo=None)
-            
-            days_since_push = (now - pushed_at).days
-            
-            if days_since_push > 365:
+        days_since_push = get_days_since_push(repo, scan_time)
+        if days_since_push is not None:
+            if days_since_push > INACTIVE_DAYS:
                 issues['violations'].append(f'Repository inactive for {days_since_push} days (1+ years)')
                 issues['labels'].append('activity:archived')
-            elif days_since_push > 180:
+            elif days_since_push > STALE_DAYS:
                 issues['violations'].append(f'Repository stale for {days_since_push} days (6+ months)')
                 issues['labels'].append('activity:stale')
         else:
@@ -1018,7 +1486,7 @@ def check_activity_status(repo, issues):
     except Exception as e:
         print(f"⚠️ Error checking activity for {repo.name}: {e}")
 
-def check_repository_quality(repo, issues):
+def check_repository_quality(repo, issues, metadata=None):
     """Check repository size and content quality"""
     try:
         # Check repository size (in KB)
@@ -1031,97 +1499,128 @@ def check_repository_quality(repo, issues):
             
         # Check if repository has topics (for discoverability)
         try:
-            topics = repo.get_topics()
-            if len(topics) == 0:
+            if metadata is not None:
+                topic_count = metadata['topic_count']
+            else:
+                topic_count = len(repo.get_topics())
+            if topic_count == 0:
                 issues['violations'].append('Repository has no topics for discoverability')
                 issues['labels'].append('missing:topics')
-        except:
+        except RateLimitExceededException:
+            raise
+        except GithubException:
             pass  # Topics API might not be accessible
             
+    except RateLimitExceededException:
+        raise
     except Exception as e:
         print(f"⚠️ Error checking quality for {repo.name}: {e}")
 
+def apply_labels_to_repositories(github_client, non_compliant_repos, max_workers=16):
+    """Apply compliance labels to (repo, issues) pairs concurrently"""
+    if not non_compliant_repos:
+        return
+
+    def apply_one(repo_and_issues):
+        repo, issues = repo_and_issues
+        try:
+            throttle_on_low_rate_limit(github_client)
+            success_count = apply_compliance_labels(repo, issues['labels'])
+            if success_count > 0:
+                print(f"  ✅ Applied {success_count}/{len(issues['labels'])} labels to {repo.name}")
+        except Exception as e:
+            print(f"❌ Error applying labels to {repo.name}: {e}")
+
+    print(f"🏷️ Applying labels to {len(non_compliant_repos)} non-compliant repositories...")
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(apply_one, non_compliant_repos))
+
+# Label colors for compliance labels, shared by every repository
+LABEL_COLORS = {
+    'naming:missing-prefix': 'f66a0a',           # Orange
+    'naming:non-compliant': 'f66a0a',            # Orange
+    'missing:readme': 'd73a49',                  # Red
+    'missing:gitignore': 'd73a49',               # Red
+    'missing:license': 'fbca04',                 # Yellow
+    'missing:codeowners': 'fbca04',              # Yellow
+    'missing:description': 'fbca04',             # Yellow
+    'missing:topics': 'fbca04',                  # Yellow
+    'security:no-branch-protection': 'd73a49',   # Red
+    'security:insufficient-protection': 'f66a0a', # Orange
+    'security:branch-access-error': '6a737d',    # Gray
+    'activity:stale': 'f66a0a',                  # Orange
+    'activity:archived': '24292e',               # Black
+    'activity:never-used': '6a737d',             # Gray
+    'quality:empty': '6a737d',                   # Gray
+    'quality:minimal': '6a737d',                 # Gray
+}
+
 def apply_compliance_labels(repo, labels):
     """Apply compliance labels to repository"""
     if not labels:
         return 0
     
-    # Define label colors
-    label_colors = {
-        'naming:missing-prefix': 'f66a0a',           # Orange
-        'naming:non-compliant': 'f66a0a',            # Orange
-        'missing:readme': 'd73a49',                  # Red
-        'missing:gitignore': 'd73a49',               # Red
-        'missing:license': 'fbca04',                 # Yellow
-        'missing:codeowners': 'fbca04',              # Yellow
-        'missing:description': 'fbca04',             # Yellow
-        'missing:topics': 'fbca04',                  # Yellow
-        'security:no-branch-protection': 'd73a49',   # Red
-        'security:insufficient-protection': 'f66a0a', # Orange
-        'security:branch-access-error': '6a737d',    # Gray
-        'activity:stale': 'f66a0a',                  # Orange
-        'activity:archived': '24292e',               # Black
-        'activity:never-used': '6a737d',             # Gray
-        'quality:empty': '6a737d',                   # Gray
-        'quality:minimal': '6a737d',                 # Gray
-    }
-    
+    # Repositories are labelled concurrently, so each one's lines are collected and printed together
+    log = [f"  🏷️ Labels for {repo.name}:"]
     success_count = 0
     
+    # Fetch existing labels once per repository rather than once per label
+    try:
+        existing_labels = {label.name for label in repo.get_labels()}
+    except Exception as e:
+        log.append(f"    ❌ Error listing labels: {e}")
+        print('\n'.join(log))
+        return 0
+    
+    # Diff once against the existing labels so only the missing ones need a create call
+    missing_labels = [label_name for label_name in dict.fromkeys(labels) if label_name not in existing_labels]
+    
     for label_name in labels:
+        if label_name in existing_labels:
+            success_count += 1
+            log.append(f"    ℹ️ Label already exists: {label_name}")
+    
+    for label_name in missing_labels:
         try:
-            # Check if label already exists in repository
-            existing_labels = [label.name for label in repo.get_labels()]
+            # Create label with appropriate color
+            color = LABEL_COLORS.get(label_name, '6a737d')  # Default gray
+            description = f"Compliance issue: {label_name.replace(':', ' - ')}"
+            
+            repo.create_label(label_name, color, description)
+            success_count += 1
+            log.append(f"    ✅ Applied label: {label_name}")
             
-            if label_name not in existing_labels:
-                # Create label with appropriate color
-                color = label_colors.get(label_name, '6a737d')  # Default gray
-                description = f"Compliance issue: {label_name.replace(':', ' - ')}"
-                
-                repo.create_label(label_name, color, description)
-                success_count += 1
-                print(f"  ✅ Applied label: {label_name}")
-            else:
-                success_count += 1
-                print(f"  ℹ️ Label already exists: {label_name}")
-                
         except Exception as e:
-            print(f"  ❌ Error applying label {label_name}: {e}")
+            log.append(f"    ❌ Error applying label {label_name}: {e}")
     
+    print('\n'.join(log))
     return success_count
 
-def generate_compliance_report(org_name, issues, total_repos):
-    """Generate comprehensive compliance report"""
+def generate_compliance_report(org_name, issues, total_repos, scan_time=None):
+    """Generate comprehensive compliance report, dated with the scan timestamp"""
     compliant_repos = total_repos - len(issues)
     compliance_rate = (compliant_repos / total_repos * 100) if total_repos > 0 else 100
     
-    # Analyze issue types
-    issue_categories = {}
-    label_counts = {}
-    
-    for issue in issues:
-        for violation in issue['violations']:
-            # Categorize by first word of violation
-            category = violation.split()[0].lower()
-            issue_categories[category] = issue_categories.get(category, 0) + 1
-        
-        for label in issue['labels']:
-            label_counts[label] = label_counts.get(label, 0) + 1
+    # Analyze issue types and repository characteristics in a single pass
+    issue_categories = Counter()
+    label_counts = Counter()
     
-    # Analyze by repository characteristics
     repo_analysis = {
         'by_visibility': {'public': 0, 'private': 0},
-        'by_language': {},
+        'by_language': Counter(),
         'by_size': {'empty': 0, 'small': 0, 'medium': 0, 'large': 0}
     }
     
     for issue in issues:
+        # Categorize by first word of violation
+        issue_categories.update(violation.split(None, 1)[0].lower() for violation in issue['violations'])
+        label_counts.update(issue['labels'])
+        
         # Count by visibility
         repo_analysis['by_visibility'][issue['visibility']] += 1
         
         # Count by language
-        lang = issue['language']
-        repo_analysis['by_language'][lang] = repo_analysis['by_language'].get(lang, 0) + 1
+        repo_analysis['by_language'][issue['language']] += 1
         
         # Count by size
         size = issue['size']
@@ -1137,7 +1636,7 @@ def generate_compliance_report(org_name, issues, total_repos):
     report = {
         'metadata': {
             'organization': org_name,
-            'scan_date': datetime.utcnow().isoformat(),
+            'scan_date': (scan_time or datetime.now(timezone.utc)).replace(tzinfo=None).isoformat(),
             'generated_by': 'Repository Compliance Checker v3.0 with Auto-Assignment',
             'total_repositories_scanned': total_repos
         },
@@ -1145,20 +1644,26 @@ def generate_compliance_report(org_name, issues, total_repos):
             'total_repositories': total_repos,
             'compliant_repositories': compliant_repos,
             'non_compliant_repositories': len(issues),
-            'compliance_rate': round(compliance_rate, 1)
+            'compliance_rate': round(compliance_rate, 1),
+            'compliant_percentage': round(compliant_repos / total_repos * 100, 1) if total_repos > 0 else 0.0,
+            'non_compliant_percentage': round(len(issues) / total_repos * 100, 1) if total_repos > 0 else 0.0
         },
         'analysis': {
             'issue_categories': issue_categories,
             'label_distribution': label_counts,
             'repository_analysis': repo_analysis,
-            'top_violations': sorted(issue_categories.items(), key=lambda x: x[1], reverse=True)[:10]
+            'top_violations': issue_categories.most_common(10)
         },
         'repositories': issues
     }
     
     # Save JSON report
-    with open('compliance-report.json', 'w') as f:
-        json.dump(report, f, indent=2, default=str)
+    if orjson:
+        with open('compliance-report.json', 'wb') as f:
+            f.write(orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME))
+    else:
+        with open('compliance-report.json', 'w') as f:
+            json.dump(report, f, indent=2, default=str)
     
     return report
 
@@ -1167,34 +1672,8 @@ def create_compliance_issues(github_client, org_name, compliance_issues, report)
     try:
         admin_repo = github_client.get_repo(f"{org_name}/admin-repo-compliance")
         
-        # Create or update daily summary issue
-        today = datetime.now().strftime('%Y-%m-%d')
-        summary_title = f"📊 Repository Compliance Report - {today}"
-        
-        summary_body = generate_summary_issue_body(org_name, report)
-        
-        # Check for existing summary issue today
-        existing_issues = list(admin_repo.get_issues(state='open', labels=['compliance-report']))
-        today_issue = None
-        
-        for issue in existing_issues:
-            if today in issue.title:
-                today_issue = issue
-                break
-        
-        if today_issue:
-            today_issue.edit(body=summary_body)
-            print(f"📝 Updated existing compliance report: #{today_issue.number}")
-        else:
-            # Create labels if they don't exist
-            ensure_admin_labels_exist(admin_repo)
-            
-            new_issue = admin_repo.create_issue(
-                title=summary_title,
-                body=summary_body,
-                labels=['compliance-report', 'automated', f'scan-{today}']
-            )
-            print(f"📋 Created compliance report issue: #{new_issue.number}")
+        # Update the single rolling summary issue instead of opening a new one each run
+        upsert_summary_issue(admin_repo, org_name, report)
         
         # Create individual high-priority issues
         create_high_priority_issues(admin_repo, compliance_issues)
@@ -1203,6 +1682,31 @@ def create_compliance_issues(github_client, org_name, compliance_issues, report)
         print(f"❌ Error creating compliance issues: {e}")
         raise
 
+def upsert_summary_issue(admin_repo, org_name, report):
+    """Update the open compliance report issue, or create it if none is open"""
+    # Dated from the scan, like the body and dashboard, so a run crossing midnight keeps one date
+    today = datetime.fromisoformat(report['metadata']['scan_date']).strftime('%Y-%m-%d')
+    summary_title = f"📊 Repository Compliance Report - {today}"
+    
+    summary_body = generate_summary_issue_body(org_name, report)
+    
+    # Most recently updated open report issue; only the first page is requested
+    report_issue = next(iter(admin_repo.get_issues(state='open', labels=['compliance-report'], sort='updated')), None)
+    
+    if report_issue:
+        report_issue.edit(title=summary_title, body=summary_body)
+        print(f"📝 Updated compliance report: #{report_issue.number}")
+    else:
+        # Create labels if they don't exist
+        ensure_admin_labels_exist(admin_repo)
+        
+        new_issue = admin_repo.create_issue(
+            title=summary_title,
+            body=summary_body,
+            labels=['compliance-report', 'automated']
+        )
+        print(f"📋 Created compliance report issue: #{new_issue.number}")
+
 def ensure_admin_labels_exist(admin_repo):
     """Ensure required labels exist in admin repository"""
     required_labels = {
@@ -1227,10 +1731,10 @@ def generate_summary_issue_body(org_name, report):
     summary = report['summary']
     analysis = report['analysis']
     
-    body = f"""# 📊 Repository Compliance Summary
+    parts = [f"""# 📊 Repository Compliance Summary
 
 **Organization:** {metadata['organization']} (auto-detected)
-**Scan Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC  
+**Scan Date:** {datetime.fromisoformat(metadata['scan_date']).strftime('%Y-%m-%d %H:%M:%S')} UTC  
 **Compliance Rate:** {summary['compliance_rate']}%  
 **Auto-Assignment:** Enabled
 
@@ -1239,27 +1743,27 @@ def generate_summary_issue_body(org_name, report):
 | Metric | Count | Percentage |
 |--------|-------|------------|
 | 📊 Total Repositories | {summary['total_repositories']} | 100% |
-| ✅ Compliant | {summary['compliant_repositories']} | {(summary['compliant_repositories']/summary['total_repositories']*100):.1f}% |
-| ❌ Non-Compliant | {summary['non_compliant_repositories']} | {(summary['non_compliant_repositories']/summary['total_repositories']*100):.1f}% |
+| ✅ Compliant | {summary['compliant_repositories']} | {summary['compliant_percentage']:.1f}% |
+| ❌ Non-Compliant | {summary['non_compliant_repositories']} | {summary['non_compliant_percentage']:.1f}% |
 
 ## 🚨 Top Violation Types
 
-"""
+"""]
     
     for violation_type, count in analysis['top_violations']:
         percentage = (count / summary['non_compliant_repositories'] * 100) if summary['non_compliant_repositories'] > 0 else 0
-        body += f"- **{violation_type.title()}**: {count} occurrences ({percentage:.1f}%)\n"
+        parts.append(f"- **{violation_type.title()}**: {count} occurrences ({percentage:.1f}%)\n")
     
-    body += f"""
+    parts.append(f"""
 
 ## 🏷️ Applied Labels
 
-"""
+""")
     
     for label, count in sorted(analysis['label_distribution'].items()):
-        body += f"- `{label}`: {count} repositories\n"
+        parts.append(f"- `{label}`: {count} repositories\n")
     
-    body += f"""
+    parts.append(f"""
 
 ## 👥 Auto-Assignment Features
 
@@ -1275,37 +1779,39 @@ def generate_summary_issue_body(org_name, report):
 - **Private:** {analysis['repository_analysis']['by_visibility']['private']} repositories
 
 ### By Language
-"""
+""")
     
-    for lang, count in sorted(analysis['repository_analysis']['by_language'].items(), key=lambda x: x[1], reverse=True)[:5]:
-        body += f"- **{lang}:** {count} repositories\n"
+    for lang, count in heapq.nlargest(5, analysis['repository_analysis']['by_language'].items(), key=lambda x: x[1]):
+        parts.append(f"- **{lang}:** {count} repositories\n")
     
-    body += f"""
+    parts.append(f"""
 
 ## 📋 Non-Compliant Repositories Summary
 
-"""
+""")
     
-    for repo in report['repositories'][:10]:  # Show first 10
-        body += f"### [{repo['name']}]({repo['url']})\n"
-        body += f"**Visibility:** {repo['visibility']} | **Size:** {repo['size']}KB | **Language:** {repo['language']}\n"
+    repositories = report['repositories']
+    for repo in repositories[:10]:  # Show first 10
+        parts.append(f"### [{repo['name']}]({repo['url']})\n")
+        parts.append(f"**Visibility:** {repo['visibility']} | **Size:** {repo['size']}KB | **Language:** {repo['language']}\n")
         
-        violation_count = len(repo['violations'])
-        body += f"**Issues:** {violation_count} violations\n"
+        violations = repo['violations']
+        violation_count = len(violations)
+        parts.append(f"**Issues:** {violation_count} violations\n")
         
         # Show first 3 violations
-        for violation in repo['violations'][:3]:
-            body += f"- ❌ {violation}\n"
+        for violation in violations[:3]:
+            parts.append(f"- ❌ {violation}\n")
         
         if violation_count > 3:
-            body += f"- ... and {violation_count - 3} more issues\n"
+            parts.append(f"- ... and {violation_count - 3} more issues\n")
         
-        body += "\n"
+        parts.append("\n")
     
-    if len(report['repositories']) > 10:
-        body += f"*... and {len(report['repositories']) - 10} more non-compliant repositories*\n\n"
+    if len(repositories) > 10:
+        parts.append(f"*... and {len(repositories) - 10} more non-compliant repositories*\n\n")
     
-    body += f"""
+    parts.append(f"""
 
 ## 🎯 Recommended Actions
 
@@ -1327,12 +1833,15 @@ View the full compliance dashboard at: https://{org_name}.github.io/admin-repo-c
 ---
 *This report was generated automatically by the Repository Compliance Checker v3.0 with Auto-Assignment*  
 *Next scan: Tomorrow at 02:00 UTC*
-"""
+""")
     
-    return body
+    return ''.join(parts)
 
-def create_high_priority_issues(admin_repo, compliance_issues):
-    """Create individual issues for high-priority violations (without assignment)"""
+def create_high_priority_issues(admin_repo, compliance_issues, max_workers=4):
+    """
+    Create individual issues for high-priority violations (without assignment)
+    Repositories are processed concurrently; a small pool keeps issue writes under the secondary rate limit
+    """
     high_priority_labels = [
         'missing:readme',
         'missing:gitignore', 
@@ -1340,21 +1849,28 @@ def create_high_priority_issues(admin_repo, compliance_issues):
         'naming:missing-prefix'
     ]
     
-    created_count = 0
-    updated_count = 0
+    try:
+        open_issues = get_open_high_priority_issues(admin_repo)
+    except Exception as e:
+        print(f"❌ Error listing open high-priority issues: {e}")
+        return
+    
+    # Only repositories with high-priority labels get their own issue
+    high_priority_issues = [repo_issue for repo_issue in compliance_issues
+                            if any(label in high_priority_labels for label in repo_issue['labels'])]
     
-    for repo_issue in compliance_issues:
+    def process_one(repo_issue):
+        """
+        Create or update the issue for one repository
+        Returns: 'created', 'updated' or None
+        """
         repo_name = repo_issue['name']
         repo_url = repo_issue['url']
         labels = repo_issue['labels']
         
-        # Check if this repository has high-priority issues
-        has_high_priority = any(label in high_priority_labels for label in labels)
+        issue_title = f"🚨 High Priority Compliance - {repo_name}"
         
-        if has_high_priority:
-            issue_title = f"🚨 High Priority Compliance - {repo_name}"
-            
-            issue_body = f"""# 🚨 High Priority Compliance Issues
+        parts = [f"""# 🚨 High Priority Compliance Issues
 
 **Repository:** [{repo_name}]({repo_url})  
 **Priority:** High  
@@ -1363,101 +1879,76 @@ def create_high_priority_issues(admin_repo, compliance_issues):
 
 ## 🔍 Issues Found
 
-"""
-            
-            critical_count = 0
-            for i, violation in enumerate(repo_issue['violations'], 1):
-                label = labels[min(i-1, len(labels)-1)] if labels else ""
-                if label in ['missing:readme', 'security:no-branch-protection']:
-                    priority_icon = "🔴 CRITICAL"
-                    critical_count += 1
-                elif label in high_priority_labels:
-                    priority_icon = "🟠 HIGH"
-                else:
-                    priority_icon = "🟡 MEDIUM"
-                
-                issue_body += f"{i}. {priority_icon} {violation}\n"
+"""]
+        
+        critical_count = 0
+        # Pair each violation with its label, reusing the last label once they run out
+        paired_labels = chain(labels, repeat(labels[-1] if labels else ""))
+        for i, (violation, label) in enumerate(zip(repo_issue['violations'], paired_labels), 1):
+            if label in ['missing:readme', 'security:no-branch-protection']:
+                priority_icon = "🔴 CRITICAL"
+                critical_count += 1
+            elif label in high_priority_labels:
+                priority_icon = "🟠 HIGH"
+            else:
+                priority_icon = "🟡 MEDIUM"
             
-            issue_body += f"""
+            parts.append(f"{i}. {priority_icon} {violation}\n")
+        
+        parts.append(f"""
 
 ## ✅ Completion Checklist
-"""
-            
-            for violation in repo_issue['violations']:
-                issue_body += f"- [ ] {violation}\n"
-            
-            issue_body += f"""
+""")
+        
+        for violation in repo_issue['violations']:
+            parts.append(f"- [ ] {violation}\n")
+        
+        parts.append(f"""
 
 ## 🏷️ Applied Labels
-{', '.join([f'`{label}`' for label in labels])}
+{', '.join(f'`{label}`' for label in labels)}
 
 ---
 *This issue was automatically created by the Repository Compliance Checker*
-"""
-            
-            # Check if issue already exists for this repo
-            existing_issues = list(admin_repo.get_issues(state='open', labels=['high-priority-compliance']))
-            repo_issue_exists = False
-            
-            for existing_issue in existing_issues:
-                if repo_name in existing_issue.title:
-                    existing_issue.edit(body=issue_body)
-                    print(f"📝 Updated high-priority issue for {repo_name}")
-                    updated_count += 1
-                    repo_issue_exists = True
-                    break
-            
-            if not repo_issue_exists:
-                try:
-                    new_issue = admin_repo.create_issue(
-                        title=issue_title,
-                        body=issue_body,
-                        labels=['high-priority-compliance', 'automated', repo_name]
-                    )
-                    print(f"🚨 Created high-priority issue for {repo_name}: #{new_issue.number}")
-                    created_count += 1
-                except Exception as e:
-                    print(f"❌ Failed to create issue for {repo_name}: {e}")
-    
-    if created_count > 0:
-        print(f"📋 Created {created_count} new high-priority issues")
-    if updated_count > 0:
-        print(f"📝 Updated {updated_count} existing high-priority issues")
-
-def generate_html_dashboard(report):
-    """Generate beautiful HTML compliance dashboard with auto-assignment info"""
-    metadata = report['metadata']
-    summary = report['summary']
-    analysis = report['analysis']
-    
-    # Calculate additional metrics with safety checks
-    total_violations = sum(analysis['issue_categories'].values()) if analysis.get('issue_categories') else 0
-    critical_issues = sum(count for label, count in analysis.get('label_distribution', {}).items() 
-                         if label.startswith(('missing:readme', 'security:')))
+""")
+        
+        issue_body = ''.join(parts)
+        
+        # Check if issue already exists for this repo
+        existing_issue = open_issues.get(repo_name)
+        
+        if existing_issue:
+            # Skip the PATCH when the issue already shows this body
+            if existing_issue.body == issue_body:
+                return 'unchanged'
+            existing_issue.edit(body=issue_body)
+            print(f"📝 Updated high-priority issue for {repo_name}")
+            return 'updated'
+        
+        try:
+            new_issue = admin_repo.create_issue(
+                title=issue_title,
+                body=issue_body,
+                labels=['high-priority-compliance', 'automated', repo_name]
+            )
+            print(f"🚨 Created high-priority issue for {repo_name}: #{new_issue.number}")
+            return 'created'
+        except Exception as e:
+            print(f"❌ Failed to create issue for {repo_name}: {e}")
+            return None
     
-    # Add status badge based on compliance rate
-    compliance_rate = summary['compliance_rate']
-    if compliance_rate >= 90:
-        status_class = "status-excellent"
-        status_text = "Excellent Compliance"
-    elif compliance_rate >= 70:
-        status_class = "status-good"
-        status_text = "Good Compliance"
-    elif compliance_rate >= 50:
-        status_class = "status-needs-improvement"  
-        status_text = "Needs Improvement"
-    else:
-        status_class = "status-critical"
-        status_text = "Critical - Action Required"
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        outcomes = Counter(executor.map(process_one, high_priority_issues))
     
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Repository Compliance Dashboard - {metadata['organization']}</title>
-    <style>
-        :root {{
+    if outcomes['created'] > 0:
+        print(f"📋 Created {outcomes['created']} new high-priority issues")
+    if outcomes['updated'] > 0:
+        print(f"📝 Updated {outcomes['updated']} existing high-priority issues")
+    if outcomes['unchanged'] > 0:
+        print(f"ℹ️ {outcomes['unchanged']} high-priority issues already up to date")
+
+# Dashboard stylesheet, kept out of the page f-string so its braces need no escaping
+DASHBOARD_CSS = """        :root {
             --primary-color: #0366d6;
             --success-color: #28a745;
             --warning-color: #ffc107;
@@ -1467,28 +1958,28 @@ def generate_html_dashboard(report):
             --border-color: #e1e4e8;
             --text-color: #24292f;
             --muted-color: #586069;
-        }}
+        }
         
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: var(--light-gray);
             color: var(--text-color);
             line-height: 1.6;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
-        .header {{
+        .header {
             background: white;
             padding: 30px;
             border-radius: 12px;
@@ -1496,36 +1987,36 @@ def generate_html_dashboard(report):
             margin-bottom: 30px;
             text-align: center;
             border-left: 6px solid var(--primary-color);
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 2.5rem;
             margin-bottom: 10px;
             color: var(--primary-color);
             font-weight: 700;
-        }}
+        }
         
-        .header .subtitle {{
+        .header .subtitle {
             color: var(--muted-color);
             font-size: 1.1rem;
             margin-bottom: 15px;
-        }}
+        }
         
-        .status-badge {{
+        .status-badge {
             display: inline-block;
             padding: 8px 16px;
             border-radius: 20px;
             font-weight: 600;
             font-size: 1rem;
             margin: 5px;
-        }}
+        }
         
-        .status-excellent {{ background: #d4edda; color: #155724; }}
-        .status-good {{ background: #d1ecf1; color: #0c5460; }}
-        .status-needs-improvement {{ background: #fff3cd; color: #856404; }}
-        .status-critical {{ background: #f8d7da; color: #721c24; }}
+        .status-excellent { background: #d4edda; color: #155724; }
+        .status-good { background: #d1ecf1; color: #0c5460; }
+        .status-needs-improvement { background: #fff3cd; color: #856404; }
+        .status-critical { background: #f8d7da; color: #721c24; }
         
-        .assignment-badge {{
+        .assignment-badge {
             background: linear-gradient(135deg, #e3f2fd, #bbdefb);
             color: var(--primary-color);
             padding: 8px 16px;
@@ -1533,16 +2024,16 @@ def generate_html_dashboard(report):
             font-weight: 600;
             font-size: 0.9rem;
             margin: 5px;
-        }}
+        }
         
-        .metrics-grid {{
+        .metrics-grid {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
             gap: 25px;
             margin-bottom: 40px;
-        }}
+        }
         
-        .metric-card {{
+        .metric-card {
             background: white;
             padding: 30px;
             border-radius: 12px;
@@ -1550,94 +2041,94 @@ def generate_html_dashboard(report):
             text-align: center;
             border-left: 6px solid var(--primary-color);
             transition: transform 0.2s ease;
-        }}
+        }
         
-        .metric-card:hover {{
+        .metric-card:hover {
             transform: translateY(-2px);
-        }}
+        }
         
-        .metric-card.success {{ border-left-color: var(--success-color); }}
-        .metric-card.danger {{ border-left-color: var(--danger-color); }}
-        .metric-card.warning {{ border-left-color: var(--warning-color); }}
+        .metric-card.success { border-left-color: var(--success-color); }
+        .metric-card.danger { border-left-color: var(--danger-color); }
+        .metric-card.warning { border-left-color: var(--warning-color); }
         
-        .metric-card h3 {{
+        .metric-card h3 {
             font-size: 0.9rem;
             color: var(--muted-color);
             margin-bottom: 15px;
             text-transform: uppercase;
             letter-spacing: 1px;
             font-weight: 600;
-        }}
+        }
         
-        .metric-card .value {{
+        .metric-card .value {
             font-size: 3rem;
             font-weight: 700;
             margin-bottom: 10px;
             line-height: 1;
-        }}
+        }
         
-        .metric-card .percentage {{
+        .metric-card .percentage {
             font-size: 1.2rem;
             color: var(--muted-color);
             font-weight: 500;
-        }}
+        }
         
-        .success {{ color: var(--success-color); }}
-        .danger {{ color: var(--danger-color); }}
-        .warning {{ color: var(--warning-color); }}
-        .primary {{ color: var(--primary-color); }}
+        .success { color: var(--success-color); }
+        .danger { color: var(--danger-color); }
+        .warning { color: var(--warning-color); }
+        .primary { color: var(--primary-color); }
         
-        .charts-section {{
+        .charts-section {
             display: grid;
             grid-template-columns: 1fr 1fr;
             gap: 30px;
             margin-bottom: 40px;
-        }}
+        }
         
-        .chart-card {{
+        .chart-card {
             background: white;
             padding: 30px;
             border-radius: 12px;
             box-shadow: 0 2px 8px rgba(0,0,0,0.1);
             border-left: 6px solid var(--info-color);
-        }}
+        }
         
-        .chart-card h3 {{
+        .chart-card h3 {
             margin-bottom: 25px;
             color: var(--text-color);
             font-size: 1.3rem;
             font-weight: 600;
-        }}
+        }
         
-        .no-data {{
+        .no-data {
             text-align: center;
             color: var(--muted-color);
             font-style: italic;
             padding: 20px;
-        }}
+        }
         
-        .violation-item, .label-item {{
+        .violation-item, .label-item {
             display: flex;
             justify-content: space-between;
             align-items: center;
             padding: 12px 0;
             border-bottom: 1px solid var(--border-color);
-        }}
+        }
         
-        .violation-item:last-child, .label-item:last-child {{
+        .violation-item:last-child, .label-item:last-child {
             border-bottom: none;
-        }}
+        }
         
-        .count-badge {{
+        .count-badge {
             background: var(--light-gray);
             color: var(--text-color);
             padding: 4px 12px;
             border-radius: 12px;
             font-weight: 600;
             font-size: 0.9rem;
-        }}
+        }
         
-        .success-message {{
+        .success-message {
             background: linear-gradient(135deg, #d4edda, #c3e6cb);
             color: #155724;
             padding: 40px;
@@ -1645,14 +2136,14 @@ def generate_html_dashboard(report):
             text-align: center;
             margin: 30px 0;
             border-left: 6px solid var(--success-color);
-        }}
+        }
         
-        .success-message h2 {{
+        .success-message h2 {
             font-size: 2rem;
             margin-bottom: 15px;
-        }}
+        }
         
-        .footer {{
+        .footer {
             text-align: center;
             margin-top: 50px;
             padding: 30px;
@@ -1660,35 +2151,82 @@ def generate_html_dashboard(report):
             border-radius: 12px;
             color: var(--muted-color);
             border-left: 6px solid var(--primary-color);
-        }}
+        }
         
-        .footer a {{
+        .footer a {
             color: var(--primary-color);
             text-decoration: none;
             font-weight: 600;
-        }}
+        }
         
-        @media (max-width: 768px) {{
-            .charts-section {{
+        @media (max-width: 768px) {
+            .charts-section {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .metrics-grid {{
+            .metrics-grid {
                 grid-template-columns: 1fr;
-            }}
+            }
             
-            .header h1 {{
+            .header h1 {
                 font-size: 2rem;
-            }}
-        }}
-    </style>
+            }
+        }
+"""
+
+# Dashboard label colors by label category (the part before the colon)
+DASHBOARD_LABEL_COLORS = {
+    'naming': '#f66a0a',
+    'missing': '#d73a49',
+    'security': '#d73a49',
+    'activity': '#24292e',
+    'quality': '#6a737d'
+}
+
+# Badge for a single violation on a repository card
+DASHBOARD_VIOLATION_BADGE = '<span style="display: inline-block; background: #fff5f5; color: #c53030; padding: 6px 12px; border-radius: 6px; font-size: 0.85rem; margin: 3px; border: 1px solid #fed7d7; font-weight: 500;">❌ {}</span>'
+
+def generate_html_dashboard(report):
+    """Generate beautiful HTML compliance dashboard with auto-assignment info"""
+    metadata = report['metadata']
+    summary = report['summary']
+    analysis = report['analysis']
+    
+    # Calculate additional metrics with safety checks
+    total_violations = sum(analysis['issue_categories'].values()) if analysis.get('issue_categories') else 0
+    critical_issues = sum(count for label, count in analysis.get('label_distribution', {}).items() 
+                         if label.startswith(('missing:readme', 'security:')))
+    
+    # Add status badge based on compliance rate
+    compliance_rate = summary['compliance_rate']
+    if compliance_rate >= 90:
+        status_class = "status-excellent"
+        status_text = "Excellent Compliance"
+    elif compliance_rate >= 70:
+        status_class = "status-good"
+        status_text = "Good Compliance"
+    elif compliance_rate >= 50:
+        status_class = "status-needs-improvement"  
+        status_text = "Needs Improvement"
+    else:
+        status_class = "status-critical"
+        status_text = "Critical - Action Required"
+    
+    parts = [f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Repository Compliance Dashboard - {metadata['organization']}</title>
+    <style>
+{DASHBOARD_CSS}    </style>
 </head>
 <body>
     <div class="container">
         <div class="header">
             <h1>🏢 {metadata['organization']}</h1>
             <h2>Repository Compliance Dashboard</h2>
-            <p class="subtitle">Auto-detected organization • Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
+            <p class="subtitle">Auto-detected organization • Last Updated: {datetime.fromisoformat(metadata['scan_date']).strftime('%Y-%m-%d %H:%M:%S')} UTC</p>
             <div class="status-badge {status_class}">
                 {status_text} ({compliance_rate}%)
             </div>
@@ -1705,13 +2243,13 @@ def generate_html_dashboard(report):
             <div class="metric-card success">
                 <h3>✅ Compliant</h3>
                 <div class="value success">{summary['compliant_repositories']}</div>
-                <div class="percentage">({(summary['compliant_repositories']/summary['total_repositories']*100) if summary['total_repositories'] > 0 else 0:.1f}%)</div>
+                <div class="percentage">({summary['compliant_percentage']:.1f}%)</div>
             </div>
             
             <div class="metric-card danger">
                 <h3>❌ Non-Compliant</h3>
                 <div class="value danger">{summary['non_compliant_repositories']}</div>
-                <div class="percentage">({(summary['non_compliant_repositories']/summary['total_repositories']*100) if summary['total_repositories'] > 0 else 0:.1f}%)</div>
+                <div class="percentage">({summary['non_compliant_percentage']:.1f}%)</div>
             </div>
             
             <div class="metric-card warning">
@@ -1723,63 +2261,57 @@ def generate_html_dashboard(report):
         
         <div class="charts-section">
             <div class="chart-card">
-                <h3>🚨 Top Violation Types</h3>"""
+                <h3>🚨 Top Violation Types</h3>"""]
     
     # Add violation types with safety checks
     if analysis.get('top_violations'):
         for violation_type, count in analysis['top_violations'][:8]:
             percentage = (count / total_violations * 100) if total_violations > 0 else 0
-            html_content += f"""
+            parts.append(f"""
                 <div class="violation-item">
                     <span style="font-weight: 500;">{violation_type.title()}</span>
                     <span class="count-badge">{count} ({percentage:.1f}%)</span>
-                </div>"""
+                </div>""")
     else:
-        html_content += '<div class="no-data">No violation data available</div>'
+        parts.append('<div class="no-data">No violation data available</div>')
     
-    html_content += """
+    parts.append("""
             </div>
             
             <div class="chart-card">
-                <h3>🏷️ Applied Labels</h3>"""
+                <h3>🏷️ Applied Labels</h3>""")
     
     # Add labels with safety checks
-    label_colors = {
-        'naming': '#f66a0a',
-        'missing': '#d73a49', 
-        'security': '#d73a49',
-        'activity': '#24292e',
-        'quality': '#6a737d'
-    }
-    
     if analysis.get('label_distribution'):
-        for label, count in sorted(analysis['label_distribution'].items(), key=lambda x: x[1], reverse=True)[:8]:
-            label_category = label.split(':')[0]
-            color = label_colors.get(label_category, '#6a737d')
+        for label, count in heapq.nlargest(8, analysis['label_distribution'].items(), key=lambda x: x[1]):
+            label_category = label.partition(':')[0]
+            color = DASHBOARD_LABEL_COLORS.get(label_category, '#6a737d')
             
-            html_content += f"""
+            parts.append(f"""
                 <div class="label-item">
                     <span style="background-color: {color}; color: white; padding: 6px 12px; border-radius: 6px; font-size: 0.85rem; font-weight: 600; font-family: 'Courier New', monospace;">{label}</span>
                     <span class="count-badge">{count}</span>
-                </div>"""
+                </div>""")
     else:
-        html_content += '<div class="no-data">No label data available</div>'
+        parts.append('<div class="no-data">No label data available</div>')
     
-    html_content += """
+    parts.append("""
             </div>
-        </div>"""
+        </div>""")
     
     # Add repositories section or success message
-    if report.get('repositories'):
-        html_content += """
+    repositories = report.get('repositories')
+    if repositories:
+        parts.append("""
         <div style="background: white; padding: 30px; border-radius: 12px; box-shadow: 0 2px 8px rgba(0,0,0,0.1); border-left: 6px solid var(--warning-color);">
-            <h2 style="margin-bottom: 25px; color: var(--text-color); font-size: 1.5rem; font-weight: 600;">🚨 Non-Compliant Repositories</h2>"""
+            <h2 style="margin-bottom: 25px; color: var(--text-color); font-size: 1.5rem; font-weight: 600;">🚨 Non-Compliant Repositories</h2>""")
         
-        # Show repositories sorted by number of violations
-        sorted_repos = sorted(report['repositories'], key=lambda x: len(x.get('violations', [])), reverse=True)
+        # Show the top 10 most problematic repositories without sorting the full list
+        top_repos = heapq.nlargest(10, repositories, key=lambda x: len(x.get('violations', [])))
         
-        for repo in sorted_repos[:10]:  # Show top 10 most problematic
-            html_content += f"""
+        for repo in top_repos:
+            violations = repo.get('violations', [])
+            parts.append(f"""
             <div style="border: 1px solid var(--border-color); border-radius: 10px; padding: 25px; margin-bottom: 20px; background: #fafbfc;">
                 <div style="display: flex; justify-content: space-between; align-items: flex-start; margin-bottom: 20px;">
                     <div style="font-size: 1.3rem; font-weight: 600;">
@@ -1788,34 +2320,33 @@ def generate_html_dashboard(report):
                     <div style="font-size: 0.9rem; color: var(--muted-color); text-align: right;">
                         <strong>{repo['visibility'].title()}</strong><br>
                         {repo['size']}KB • {repo['language']}<br>
-                        {len(repo.get('violations', []))} issues
+                        {len(violations)} issues
                     </div>
                 </div>
-                <div style="margin-top: 20px;">"""
+                <div style="margin-top: 20px;">""")
             
-            for violation in repo.get('violations', []):
-                html_content += f'<span style="display: inline-block; background: #fff5f5; color: #c53030; padding: 6px 12px; border-radius: 6px; font-size: 0.85rem; margin: 3px; border: 1px solid #fed7d7; font-weight: 500;">❌ {violation}</span>'
+            parts.extend(map(DASHBOARD_VIOLATION_BADGE.format, violations))
             
-            html_content += """
+            parts.append("""
                 </div>
-            </div>"""
+            </div>""")
         
-        if len(report['repositories']) > 10:
-            html_content += f"""
+        if len(repositories) > 10:
+            parts.append(f"""
             <div style="text-align: center; padding: 20px; color: var(--muted-color);">
-                <em>... and {len(report['repositories']) - 10} more non-compliant repositories</em>
-            </div>"""
+                <em>... and {len(repositories) - 10} more non-compliant repositories</em>
+            </div>""")
         
-        html_content += "</div>"
+        parts.append("</div>")
     else:
-        html_content += """
+        parts.append("""
         <div class="success-message">
             <h2>🎉 Congratulations!</h2>
             <p style="font-size: 1.3rem; margin-top: 15px;">All repositories are compliant with governance standards.</p>
             <p style="margin-top: 10px;">Your organization maintains excellent repository hygiene!</p>
-        </div>"""
+        </div>""")
     
-    html_content += f"""
+    parts.append(f"""
         <div class="footer">
             <p><strong>Repository Compliance Checker v3.0 with Auto-Assignment</strong></p>
             <p>Generated automatically for {metadata['organization']} • Next scan: Tomorrow at 02:00 UTC</p>
@@ -1827,45 +2358,56 @@ def generate_html_dashboard(report):
         </div>
     </div>
 </body>
-</html>"""
+</html>""")
     
     # Save HTML dashboard
+    # Write the chunks directly rather than joining them into one large string first
     with open('compliance-dashboard.html', 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.writelines(parts)
 
 def print_summary(report):
     """Print summary to console with auto-assignment info"""
     summary = report['summary']
     analysis = report['analysis']
     
-    print(f"\n{'='*80}")
-    print(f"📊 REPOSITORY COMPLIANCE SUMMARY WITH AUTO-ASSIGNMENT")
-    print(f"{'='*80}")
-    print(f"🏢 Organization: {report['metadata']['organization']} (auto-detected)")
-    print(f"📅 Scan Date: {report['metadata']['scan_date']}")
-    print(f"👥 Auto-Assignment: Enabled")
-    print(f"📊 Total Repositories: {summary['total_repositories']}")
-    print(f"✅ Compliant: {summary['compliant_repositories']} ({(summary['compliant_repositories']/summary['total_repositories']*100):.1f}%)")
-    print(f"❌ Non-Compliant: {summary['non_compliant_repositories']} ({(summary['non_compliant_repositories']/summary['total_repositories']*100):.1f}%)")
-    print(f"📈 Compliance Rate: {summary['compliance_rate']}%")
+    # One write for the whole block instead of a print per line
+    print('\n'.join([
+        f"\n{'='*80}",
+        f"📊 REPOSITORY COMPLIANCE SUMMARY WITH AUTO-ASSIGNMENT",
+        f"{'='*80}",
+        f"🏢 Organization: {report['metadata']['organization']} (auto-detected)",
+        f"📅 Scan Date: {report['metadata']['scan_date']}",
+        f"👥 Auto-Assignment: Enabled",
+        f"📊 Total Repositories: {summary['total_repositories']}",
+        f"✅ Compliant: {summary['compliant_repositories']} ({summary['compliant_percentage']:.1f}%)",
+        f"❌ Non-Compliant: {summary['non_compliant_repositories']} ({summary['non_compliant_percentage']:.1f}%)",
+        f"📈 Compliance Rate: {summary['compliance_rate']}%",
+    ]))
 
 def print_recommendations(report, dry_run):
     """Print actionable recommendations with assignment info"""
     summary = report['summary']
-    
-    print(f"\n💡 RECOMMENDATIONS & NEXT STEPS")
-    print(f"{'='*80}")
+    org_name = report['metadata']['organization']
     
     if summary['compliance_rate'] == 100:
-        print(f"🎉 Excellent! All repositories are compliant.")
-        print(f"✅ Continue monitoring with daily scans and auto-assignment")
+        next_steps = [
+            f"🎉 Excellent! All repositories are compliant.",
+            f"✅ Continue monitoring with daily scans and auto-assignment",
+        ]
     else:
-        print(f"👥 Auto-assignment will ensure issues are tracked by responsible parties")
-        print(f"📋 Check the admin repository for assigned compliance issues")
-    
-    print(f"\n📊 View the dashboard at:")
-    org_name = report['metadata']['organization']
-    print(f"   https://{org_name}.github.io/admin-repo-compliance")
+        next_steps = [
+            f"👥 Auto-assignment will ensure issues are tracked by responsible parties",
+            f"📋 Check the admin repository for assigned compliance issues",
+        ]
+    
+    # One write for the whole block instead of a print per line
+    print('\n'.join([
+        f"\n💡 RECOMMENDATIONS & NEXT STEPS",
+        f"{'='*80}",
+        *next_steps,
+        f"\n📊 View the dashboard at:",
+        f"   https://{org_name}.github.io/admin-repo-compliance",
+    ]))
 
 def set_github_actions_output(key, value):
     """Set GitHub Actions step output"""
@@ -1896,8 +2438,8 @@ def create_github_actions_summary(report):
 | Metric | Count | Percentage |
 |--------|-------|------------|
 | 📊 Total Repositories | {summary['total_repositories']} | 100% |
-| ✅ Compliant | {summary['compliant_repositories']} | {(summary['compliant_repositories']/summary['total_repositories']*100):.1f}% |
-| ❌ Non-Compliant | {summary['non_compliant_repositories']} | {(summary['non_compliant_repositories']/summary['total_repositories']*100):.1f}% |
+| ✅ Compliant | {summary['compliant_repositories']} | {summary['compliant_percentage']:.1f}% |
+| ❌ Non-Compliant | {summary['non_compliant_repositories']} | {summary['non_compliant_percentage']:.1f}% |
 
 ## 👥 Auto-Assignment Features
 